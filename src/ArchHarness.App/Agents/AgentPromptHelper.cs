@@ -73,8 +73,8 @@ internal static class AgentPromptHelper
             output.Add("vue3");
         }
 
-        bool hasCsproj = Directory.GetFiles(workspaceRoot, "*.csproj", SearchOption.AllDirectories).Length > 0;
-        bool hasCs = Directory.GetFiles(workspaceRoot, "*.cs", SearchOption.AllDirectories).Length > 0;
+        bool hasCsproj = Directory.EnumerateFiles(workspaceRoot, "*.csproj", SearchOption.AllDirectories).Any();
+        bool hasCs = Directory.EnumerateFiles(workspaceRoot, "*.cs", SearchOption.AllDirectories).Any();
         if (hasCsproj || hasCs || filesTouched.Any(x => x.EndsWith(".cs", StringComparison.OrdinalIgnoreCase)))
         {
             output.Add("dotnet");
@@ -11,6 +11,9 @@ internal static class AnalysisRunner
 {
     private const string SEVERITY_HIGH = "high";
     private const string SEVERITY_MEDIUM = "medium";
+    private const string SEVERITY_LOW = "low";
+    private const int PARALLEL_PARSE_THRESHOLD = 8;
+    private const long MAX_ANALYZED_FILE_BYTES = 1024 * 1024;
 
     private static readonly IReadOnlyList<IArchitectureAnalyzer> Analyzers = new IArchitectureAnalyzer[]
     {
@@ -42,7 +45,20 @@ internal static class AnalysisRunner
             requiredActions.Add("Remove TODO markers and complete implementation details.");
         }
 
-        List<string> candidateFiles = ResolveCandidateFiles(diff, workspaceRoot);
+        List<string> skippedFiles = new List<string>();
+        List<string> candidateFiles = ResolveCandidateFiles(diff, workspaceRoot, skippedFiles);
+
+        // Oversized sources are left out of parsing, so say so in the review rather than dropping them silently.
+        foreach (string skipped in skippedFiles)
+        {
+            findings.Add(new ArchitectureFinding(
+                SEVERITY_LOW,
+                "Coverage",
+                Path.GetRelativePath(workspaceRoot, skipped),
+                "SkippedFile",
+                $"File exceeds {MAX_ANALYZED_FILE_BYTES / 1024} KiB and was not statically analyzed."));
+        }
+
         if (candidateFiles.Count == 0)
         {
             return new ArchitectureReview(findings, requiredActions.ToArray());
@@ -76,10 +92,12 @@ internal static class AnalysisRunner
     /// </summary>
     /// <param name="diff">The current diff snapshot.</param>
     /// <param name="workspaceRoot">The workspace root path.</param>
+    /// <param name="skippedFiles">Receives existing candidates left out because they exceed the size cap.</param>
     /// <returns>A list of absolute file paths.</returns>
-    internal static List<string> ResolveCandidateFiles(string diff, string workspaceRoot)
+    internal static List<string> ResolveCandidateFiles(string diff, string workspaceRoot, List<string> skippedFiles)
     {
         List<string> output = new List<string>();
+        bool diffNamedSources = false;
         string[] lines = diff.Split(new[] { '\r', '\n' }, StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries);
         foreach (string line in lines)
         {
@@ -96,35 +114,76 @@ internal static class AnalysisRunner
                 continue;
             }
 
-            string fullPath = Path.GetFullPath(Path.Combine(workspaceRoot, line));
-            if (File.Exists(fullPath))
+            FileInfo info = new FileInfo(Path.GetFullPath(Path.Combine(workspaceRoot, line)));
+            if (!info.Exists)
             {
-                output.Add(fullPath);
+                continue;
+            }
+
+            diffNamedSources = true;
+            if (IsWithinSizeCap(info.Length))
+            {
+                output.Add(info.FullName);
+            }
+            else
+            {
+                skippedFiles.Add(info.FullName);
             }
         }
 
-        if (output.Count > 0)
+        // Only scan the whole workspace when the diff named no sources at all; a diff touching nothing but
+        // oversized files must not turn into a full-repository parse.
+        if (diffNamedSources)
         {
             return output;
         }
 
-        return Directory.GetFiles(workspaceRoot, "*.cs", SearchOption.AllDirectories)
-            .Where(f => !f.Contains("\\bin\\", StringComparison.OrdinalIgnoreCase)
-                     && !f.Contains("\\obj\\", StringComparison.OrdinalIgnoreCase))
-            .ToList();
+        string root = Path.GetFullPath(workspaceRoot);
+        foreach ((string relativePath, long length, long _) in WorkspaceSnapshotHelper.EnumerateFiles(root))
+        {
+            if (!relativePath.EndsWith(".cs", StringComparison.OrdinalIgnoreCase))
+            {
+                continue;
+            }
+
+            string fullPath = Path.Combine(root, relativePath);
+            if (IsWithinSizeCap(length))
+            {
+                output.Add(fullPath);
+            }
+            else
+            {
+                skippedFiles.Add(fullPath);
+            }
+        }
+
+        return output;
     }
 
-    private static List<ParsedFile> ParseFiles(IEnumerable<string> files)
+    // Very large sources are almost always generated; parsing them costs far more than any finding is worth.
+    private static bool IsWithinSizeCap(long length)
+        => length <= MAX_ANALYZED_FILE_BYTES;
+
+    private static List<ParsedFile> ParseFiles(IReadOnlyList<string> files)
     {
-        List<ParsedFile> parsed = new List<ParsedFile>();
-        foreach (string file in files)
+        // Typical reviews touch a handful of files, where partitioning costs more than it saves.
+        if (files.Count < PARALLEL_PARSE_THRESHOLD)
         {
-            string content = File.ReadAllText(file);
-            Microsoft.CodeAnalysis.SyntaxTree tree = CSharpSyntaxTree.ParseText(content);
-            Microsoft.CodeAnalysis.SyntaxNode root = tree.GetRoot();
-            parsed.Add(new ParsedFile(file, root));
+            return files.Select(ParseFile).ToList();
         }
 
-        return parsed;
+        // Parsing is independent per file; fan out across the shared thread pool and keep input order for stable findings.
+        return files
+            .AsParallel()
+            .AsOrdered()
+            .Select(ParseFile)
+            .ToList();
+    }
+
+    private static ParsedFile ParseFile(string file)
+    {
+        string content = File.ReadAllText(file);
+        Microsoft.CodeAnalysis.SyntaxTree tree = CSharpSyntaxTree.ParseText(content);
+        return new ParsedFile(file, tree.GetRoot());
     }
 }
@@ -58,6 +58,16 @@ public sealed class DryAnalyzer : IArchitectureAnalyzer
             return string.Empty;
         }
 
-        return string.Concat(body.Where(c => !char.IsWhiteSpace(c)));
+        Span<char> buffer = body.Length <= 512 ? stackalloc char[512] : new char[body.Length];
+        int length = 0;
+        foreach (char c in body)
+        {
+            if (!char.IsWhiteSpace(c))
+            {
+                buffer[length++] = c;
+            }
+        }
+
+        return new string(buffer[..length]);
     }
 }
@@ -107,8 +107,8 @@ internal static class ArchitecturePromptBuilder
             output.Add("vue3");
         }
 
-        bool hasCsproj = Directory.GetFiles(workspaceRoot, "*.csproj", SearchOption.AllDirectories).Length > 0;
-        bool hasCs = Directory.GetFiles(workspaceRoot, "*.cs", SearchOption.AllDirectories).Length > 0;
+        bool hasCsproj = Directory.EnumerateFiles(workspaceRoot, "*.csproj", SearchOption.AllDirectories).Any();
+        bool hasCs = Directory.EnumerateFiles(workspaceRoot, "*.cs", SearchOption.AllDirectories).Any();
         if (hasCsproj || hasCs || filesTouched.Any(x => x.EndsWith(".cs", StringComparison.OrdinalIgnoreCase)))
         {
             output.Add("dotnet");
@@ -145,17 +145,5 @@ internal static class ArchitecturePromptBuilder
     }
 
     private static string TryLoadGuidelineFile(string fileName)
-    {
-        string[] searchRoots = new[] { AppContext.BaseDirectory, Directory.GetCurrentDirectory() };
-        foreach (string root in searchRoots)
-        {
-            string path = Path.Combine(root, "Guidelines", "Architecture Review", fileName);
-            if (File.Exists(path))
-            {
-                return File.ReadAllText(path);
-            }
-        }
-
-        return "No guideline file found. Apply strict SOLID/DRY review and enforce architecture consistency.";
-    }
+        => GuidelineLoader.Load("Architecture Review", fileName, "No guideline file found. Apply strict SOLID/DRY review and enforce architecture consistency.");
 }
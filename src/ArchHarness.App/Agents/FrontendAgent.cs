@@ -134,7 +134,7 @@ public sealed class FrontendAgent : AgentBase
     }
 
     private static bool HasAnyFiles(string workspaceRoot, params string[] patterns)
-        => patterns.Any(pattern => Directory.GetFiles(workspaceRoot, pattern, RECURSIVE).Length > 0);
+        => patterns.Any(pattern => Directory.EnumerateFiles(workspaceRoot, pattern, RECURSIVE).Any());
 
     private static void AddIf(ICollection<string> output, bool condition, string value)
     {
@@ -1,3 +1,5 @@
+using System.Collections.Concurrent;
+
 namespace ArchHarness.App.Agents;
 
 /// <summary>
@@ -6,6 +8,7 @@ namespace ArchHarness.App.Agents;
 internal static class GuidelineLoader
 {
     private static readonly string[] SearchRoots = new[] { AppContext.BaseDirectory, Directory.GetCurrentDirectory() };
+    private static readonly ConcurrentDictionary<string, CachedGuideline> Cache = new ConcurrentDictionary<string, CachedGuideline>(StringComparer.Ordinal);
 
     /// <summary>
     /// Loads a guideline file from the specified subfolder under the Guidelines directory.
@@ -19,12 +22,28 @@ internal static class GuidelineLoader
         foreach (string root in SearchRoots)
         {
             string path = Path.Combine(root, "Guidelines", subfolder, fileName);
-            if (File.Exists(path))
+            FileInfo info = new FileInfo(path);
+            if (!info.Exists)
+            {
+                continue;
+            }
+
+            // Re-read only when the file's size or timestamp moved since it was cached.
+            long lastWriteUtcTicks = info.LastWriteTimeUtc.Ticks;
+            if (Cache.TryGetValue(path, out CachedGuideline? cached)
+                && cached.Length == info.Length
+                && cached.LastWriteUtcTicks == lastWriteUtcTicks)
             {
-                return File.ReadAllText(path);
+                return cached.Content;
             }
+
+            string content = File.ReadAllText(path);
+            Cache[path] = new CachedGuideline(info.Length, lastWriteUtcTicks, content);
+            return content;
         }
 
         return fallbackMessage;
     }
+
+    private sealed record CachedGuideline(long Length, long LastWriteUtcTicks, string Content);
 }
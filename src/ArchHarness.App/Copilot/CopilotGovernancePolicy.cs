@@ -9,7 +9,7 @@ public interface ICopilotGovernancePolicy
     Task<PostToolUseHookOutput> OnPostToolUseAsync(PostToolUseHookInput input);
 }
 
-public sealed class CopilotGovernancePolicy : ICopilotGovernancePolicy
+public sealed partial class CopilotGovernancePolicy : ICopilotGovernancePolicy
 {
     private readonly IToolUsageLogger _toolUsageLogger;
 
@@ -70,6 +70,9 @@ public sealed class CopilotGovernancePolicy : ICopilotGovernancePolicy
         }
 
         var serialized = System.Text.Json.JsonSerializer.Serialize(toolArgs);
-        return Regex.IsMatch(serialized, "(?i)(rm\\s+-rf|drop\\s+table|truncate\\s+table|del\\s+/f|format\\s+[a-z]:)");
+        return DestructiveArgsRegex().IsMatch(serialized);
     }
+
+    [GeneratedRegex("(?i)(rm\\s+-rf|drop\\s+table|truncate\\s+table|del\\s+/f|format\\s+[a-z]:)")]
+    private static partial Regex DestructiveArgsRegex();
 }
@@ -8,6 +8,7 @@ public interface IUserInputState
     string? ActiveQuestion { get; }
     void SetAwaiting(string? question);
     void Clear();
+    Task WaitForAnswerAsync(CancellationToken cancellationToken);
 }
 
 public sealed class UserInputState : IUserInputState
@@ -15,6 +16,7 @@ public sealed class UserInputState : IUserInputState
     private readonly object _sync = new();
     private bool _awaiting;
     private string? _question;
+    private TaskCompletionSource? _answered;
 
     public bool IsAwaitingInput
     {
@@ -32,6 +34,7 @@ public sealed class UserInputState : IUserInputState
         {
             _awaiting = true;
             _question = question;
+            _answered ??= new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
         }
     }
 
@@ -41,8 +44,26 @@ public sealed class UserInputState : IUserInputState
         {
             _awaiting = false;
             _question = null;
+            _answered?.TrySetResult();
+            _answered = null;
         }
     }
+
+    public Task WaitForAnswerAsync(CancellationToken cancellationToken)
+    {
+        Task answered;
+        lock (_sync)
+        {
+            if (_answered is null)
+            {
+                return Task.CompletedTask;
+            }
+
+            answered = _answered.Task;
+        }
+
+        return answered.WaitAsync(cancellationToken);
+    }
 }
 
 public interface ICopilotUserInputBridge
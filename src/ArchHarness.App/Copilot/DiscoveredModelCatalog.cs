@@ -5,6 +5,7 @@ namespace ArchHarness.App.Copilot;
 public interface IDiscoveredModelCatalog
 {
     IReadOnlyCollection<string> GetModels();
+    bool Contains(string model);
     void ReplaceModels(IEnumerable<string> models);
     bool HasModels { get; }
 }
@@ -18,6 +19,9 @@ public sealed class DiscoveredModelCatalog : IDiscoveredModelCatalog
     public IReadOnlyCollection<string> GetModels()
         => _models.Keys.OrderBy(x => x, StringComparer.OrdinalIgnoreCase).ToArray();
 
+    public bool Contains(string model)
+        => _models.ContainsKey(model);
+
     public void ReplaceModels(IEnumerable<string> models)
     {
         _models.Clear();
@@ -204,17 +204,17 @@ internal sealed class SdkCopilotSession(
 
     private static bool IsLifecycleEvent(string eventType)
     {
-        var normalized = eventType.ToLowerInvariant();
-        return normalized.Contains("session.start", StringComparison.Ordinal)
-            || normalized.Contains("sessionstart", StringComparison.Ordinal)
-            || normalized.Contains("tool.execution.start", StringComparison.Ordinal)
-            || normalized.Contains("toolexecutionstart", StringComparison.Ordinal)
-            || normalized.Contains("tool.execution.complete", StringComparison.Ordinal)
-            || normalized.Contains("toolexecutioncomplete", StringComparison.Ordinal)
-            || normalized.Contains("session.compaction.start", StringComparison.Ordinal)
-            || normalized.Contains("sessioncompactionstart", StringComparison.Ordinal)
-            || normalized.Contains("session.compaction.complete", StringComparison.Ordinal)
-            || normalized.Contains("sessioncompactioncomplete", StringComparison.Ordinal);
+        // Runs for every SDK event, so compare case-insensitively in place rather than lowering a copy first.
+        return eventType.Contains("session.start", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("sessionstart", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("tool.execution.start", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("toolexecutionstart", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("tool.execution.complete", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("toolexecutioncomplete", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("session.compaction.start", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("sessioncompactionstart", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("session.compaction.complete", StringComparison.OrdinalIgnoreCase)
+            || eventType.Contains("sessioncompactioncomplete", StringComparison.OrdinalIgnoreCase);
     }
 
     private static string ResolveEventType(SessionEvent evt)
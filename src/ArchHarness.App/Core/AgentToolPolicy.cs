@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using Microsoft.Extensions.Options;
 
 namespace ArchHarness.App.Core;
@@ -24,7 +25,10 @@ public sealed class AgentToolPolicyProvider : IAgentToolPolicyProvider
         "edit_file"
     };
 
+    private static readonly AgentToolOptions NoTools = new();
+
     private readonly AgentsOptions _options;
+    private readonly ConcurrentDictionary<string, AgentToolPolicy> _policies = new(StringComparer.OrdinalIgnoreCase);
 
     public AgentToolPolicyProvider(IOptions<AgentsOptions> options)
     {
@@ -32,6 +36,9 @@ public sealed class AgentToolPolicyProvider : IAgentToolPolicyProvider
     }
 
     public AgentToolPolicy Resolve(string role)
+        => _policies.GetOrAdd(role, BuildRolePolicy);
+
+    private AgentToolPolicy BuildRolePolicy(string role)
     {
         var tools = role.ToLowerInvariant() switch
         {
@@ -40,7 +47,7 @@ public sealed class AgentToolPolicyProvider : IAgentToolPolicyProvider
             "style" => _options.Style.Tools,
             "architecture" => _options.Architecture.Tools,
             "orchestration" => _options.Orchestration.Tools,
-            _ => new AgentToolOptions()
+            _ => NoTools
         };
 
         return role.ToLowerInvariant() switch
@@ -11,6 +11,8 @@ public sealed class AgentModelOptions
 
 public sealed class AgentsOptions
 {
+    private static readonly AgentModelOptions UnknownRoleOptions = new();
+
     public AgentModelOptions Orchestration { get; set; } = new() { Model = "claude-sonnet-4.6" };
     public AgentModelOptions Frontend { get; set; } = new() { Model = "claude-sonnet-4.6" };
     public AgentModelOptions Builder { get; set; } = new() { Model = "gpt-5.3-codex" };
@@ -21,8 +23,9 @@ public sealed class AgentsOptions
     {
         "frontend" => Frontend,
         "builder" => Builder,
+        "style" => Style,
         "architecture" => Architecture,
         "orchestration" => Orchestration,
-        _ => new AgentModelOptions()
+        _ => UnknownRoleOptions
     };
 }
@@ -0,0 +1,14 @@
+using System.Text.Json.Serialization;
+
+namespace ArchHarness.App.Core;
+
+/// <summary>
+/// Compile-time serialization metadata for the typed run artefacts, so writing them skips reflection.
+/// These are indented because the TUI and users read them directly.
+/// </summary>
+[JsonSourceGenerationOptions(WriteIndented = true)]
+[JsonSerializable(typeof(ExecutionPlan))]
+[JsonSerializable(typeof(ArchitectureReview))]
+internal sealed partial class ArtefactJsonContext : JsonSerializerContext
+{
+}
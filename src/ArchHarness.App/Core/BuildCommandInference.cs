@@ -4,10 +4,8 @@ namespace ArchHarness.App.Core;
 
 public sealed record BuildCommandSelection(string? Command, bool Inferred, string Reason);
 
-public static class BuildCommandInference
+public static partial class BuildCommandInference
 {
-    private static readonly Regex TargetRegex = new("\\.(sln|csproj)(?=(\"|'|\\s|$))", RegexOptions.IgnoreCase | RegexOptions.Compiled);
-
     private sealed record InferenceRule(Func<string?, string, string?, bool> Predicate, Func<string?, string, string?, BuildCommandSelection> Result);
 
     private static readonly InferenceRule[] NoCommandRules = new InferenceRule[]
@@ -29,8 +27,8 @@ public static class BuildCommandInference
         string? projectName)
     {
         var normalizedRoot = Path.GetFullPath(Environment.ExpandEnvironmentVariables(workspaceRoot));
-        var target = ResolveBestBuildTarget(normalizedRoot, projectName);
 
+        // The target scan walks the whole workspace, so only run it once a rule actually needs it.
         if (!string.IsNullOrWhiteSpace(requestedBuildCommand))
         {
             var trimmed = requestedBuildCommand.Trim();
@@ -44,10 +42,11 @@ public static class BuildCommandInference
                 return new BuildCommandSelection(trimmed, Inferred: false, Reason: "User-specified build command already includes a target path.");
             }
 
-            if (!string.IsNullOrWhiteSpace(target))
+            var discoveredTarget = ResolveBestBuildTarget(normalizedRoot, projectName);
+            if (!string.IsNullOrWhiteSpace(discoveredTarget))
             {
                 return new BuildCommandSelection(
-                    InjectTargetIntoDotnetBuild(trimmed, target),
+                    InjectTargetIntoDotnetBuild(trimmed, discoveredTarget),
                     Inferred: true,
                     Reason: "Injected discovered solution/project target into user-specified dotnet build command.");
             }
@@ -55,6 +54,7 @@ public static class BuildCommandInference
             return new BuildCommandSelection(trimmed, Inferred: false, Reason: "No solution/project target discovered to inject.");
         }
 
+        var target = ResolveBestBuildTarget(normalizedRoot, projectName);
         InferenceRule? matchedRule = NoCommandRules.FirstOrDefault(rule => rule.Predicate(target, workspaceMode, projectName));
         if (matchedRule != null)
         {
@@ -65,7 +65,7 @@ public static class BuildCommandInference
     }
 
     private static bool ContainsBuildTarget(string command)
-        => TargetRegex.IsMatch(command);
+        => TargetRegex().IsMatch(command);
 
     private static string InjectTargetIntoDotnetBuild(string command, string targetPath)
     {
@@ -83,27 +83,34 @@ public static class BuildCommandInference
             return null;
         }
 
-        var slnFiles = Directory.GetFiles(workspaceRoot, "*.sln", SearchOption.AllDirectories)
-            .Where(IsBuildCandidate)
-            .OrderBy(p => p, StringComparer.OrdinalIgnoreCase)
-            .ToArray();
+        // One pruned walk collects both candidate kinds; bin/obj and the harness directories are never entered.
+        var slnCandidates = new List<string>();
+        var csprojCandidates = new List<string>();
+        foreach (var path in WorkspaceSnapshotHelper.EnumerateFilePaths(workspaceRoot))
+        {
+            if (path.EndsWith(".sln", StringComparison.OrdinalIgnoreCase))
+            {
+                slnCandidates.Add(path);
+            }
+            else if (path.EndsWith(".csproj", StringComparison.OrdinalIgnoreCase))
+            {
+                csprojCandidates.Add(path);
+            }
+        }
 
-        if (slnFiles.Length > 0)
+        if (slnCandidates.Count > 0)
         {
+            var slnFiles = slnCandidates.OrderBy(p => p, StringComparer.OrdinalIgnoreCase).ToArray();
             var sln = PickByProjectNameOrFirst(slnFiles, projectName);
             return Path.GetFullPath(sln);
         }
 
-        var csprojFiles = Directory.GetFiles(workspaceRoot, "*.csproj", SearchOption.AllDirectories)
-            .Where(IsBuildCandidate)
-            .OrderBy(p => p, StringComparer.OrdinalIgnoreCase)
-            .ToArray();
-
-        if (csprojFiles.Length == 0)
+        if (csprojCandidates.Count == 0)
         {
             return null;
         }
 
+        var csprojFiles = csprojCandidates.OrderBy(p => p, StringComparer.OrdinalIgnoreCase).ToArray();
         var preferred = csprojFiles
             .Where(p => !Path.GetFileNameWithoutExtension(p).Contains("test", StringComparison.OrdinalIgnoreCase))
             .OrderBy(p => p.Contains($"{Path.DirectorySeparatorChar}src{Path.DirectorySeparatorChar}", StringComparison.OrdinalIgnoreCase) ? 0 : 1)
@@ -128,10 +135,6 @@ public static class BuildCommandInference
         return files[0];
     }
 
-    private static bool IsBuildCandidate(string path)
-    {
-        var normalized = path.Replace('/', Path.DirectorySeparatorChar).Replace('\\', Path.DirectorySeparatorChar);
-        return !normalized.Contains($"{Path.DirectorySeparatorChar}bin{Path.DirectorySeparatorChar}", StringComparison.OrdinalIgnoreCase)
-            && !normalized.Contains($"{Path.DirectorySeparatorChar}obj{Path.DirectorySeparatorChar}", StringComparison.OrdinalIgnoreCase);
-    }
-}
\ No newline at end of file
+    [GeneratedRegex("\\.(sln|csproj)(?=(\"|'|\\s|$))", RegexOptions.IgnoreCase)]
+    private static partial Regex TargetRegex();
+}
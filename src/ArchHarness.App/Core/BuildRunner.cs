@@ -39,9 +39,14 @@ public sealed class BuildRunner : IBuildRunner
 
         using var process = new Process { StartInfo = info };
         process.Start();
-        var stdout = await process.StandardOutput.ReadToEndAsync(cancellationToken);
-        var stderr = await process.StandardError.ReadToEndAsync(cancellationToken);
-        await process.WaitForExitAsync(cancellationToken);
+
+        // Drain both pipes together: reading them one after the other serializes the waits and can
+        // deadlock once the build fills the stderr pipe buffer while stdout is still being read.
+        var stdoutTask = process.StandardOutput.ReadToEndAsync(cancellationToken);
+        var stderrTask = process.StandardError.ReadToEndAsync(cancellationToken);
+        await Task.WhenAll(stdoutTask, stderrTask, process.WaitForExitAsync(cancellationToken));
+        var stdout = await stdoutTask;
+        var stderr = await stderrTask;
 
         var output = string.Join(Environment.NewLine, new[] { stdout, stderr }.Where(x => !string.IsNullOrWhiteSpace(x)));
         return new BuildResult(Executed: true, Passed: process.ExitCode == 0, ExitCode: process.ExitCode, Output: Redaction.RedactSecrets(output));
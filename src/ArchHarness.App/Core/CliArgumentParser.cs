@@ -141,20 +141,25 @@ internal static class CliArgumentParser
         }
 
         Dictionary<string, string> output = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
-        string[] segments = overrideText.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries);
-        foreach (string segment in segments)
+        ReadOnlySpan<char> remaining = overrideText;
+        while (!remaining.IsEmpty)
         {
+            int comma = remaining.IndexOf(',');
+            ReadOnlySpan<char> segment = comma < 0 ? remaining : remaining[..comma];
+            remaining = comma < 0 ? ReadOnlySpan<char>.Empty : remaining[(comma + 1)..];
+
+            // Only role=model pairs are supported, so slice the segment directly instead of splitting it.
             int idx = segment.IndexOf('=');
-            if (idx <= 0 || idx == segment.Length - 1)
+            if (idx < 0)
             {
                 continue;
             }
 
-            string role = segment[..idx].Trim();
-            string model = segment[(idx + 1)..].Trim();
-            if (!string.IsNullOrWhiteSpace(role) && !string.IsNullOrWhiteSpace(model))
+            ReadOnlySpan<char> role = segment[..idx].Trim();
+            ReadOnlySpan<char> model = segment[(idx + 1)..].Trim();
+            if (!role.IsEmpty && !model.IsEmpty)
             {
-                output[role] = model;
+                output[role.ToString()] = model.ToString();
             }
         }
 
@@ -96,10 +96,11 @@ public sealed class ConversationController
             ArchitectureLoopPrompt = architectureLoopPrompt
         };
 
+        // Navigation keys only move the selection, so the field list is rebuilt just when the draft can change.
         int selectedIndex = 0;
+        List<SetupField> fields = SetupFieldEditor.BuildFields(draft);
         while (true)
         {
-            List<SetupField> fields = SetupFieldEditor.BuildFields(draft);
             if (selectedIndex >= fields.Count)
             {
                 selectedIndex = fields.Count - 1;
@@ -116,6 +117,7 @@ public sealed class ConversationController
 
             if (SetupNavigator.TryHandleModeToggle(key.Key, fields[selectedIndex], draft))
             {
+                fields = SetupFieldEditor.BuildFields(draft);
                 continue;
             }
 
@@ -126,6 +128,7 @@ public sealed class ConversationController
                     return completedRequest;
                 }
 
+                fields = SetupFieldEditor.BuildFields(draft);
                 continue;
             }
         }
@@ -7,7 +7,7 @@ namespace ArchHarness.App.Core;
 /// Parses and validates execution plan JSON into strongly-typed <see cref="ExecutionPlan"/> instances.
 /// Owns schema validation, step normalization, and JSON extraction from raw model responses.
 /// </summary>
-public sealed class ExecutionPlanParser
+public sealed partial class ExecutionPlanParser
 {
     private const string FRONTEND_AGENT_NAME = "Frontend";
     private const string BUILDER_AGENT_NAME = "Builder";
@@ -482,7 +482,7 @@ public sealed class ExecutionPlanParser
 
     internal static string? ExtractJson(string text)
     {
-        Match fenceMatch = Regex.Match(text, @"```(?:json)?\s*\n?(\{[\s\S]*?\})\s*```", RegexOptions.IgnoreCase);
+        Match fenceMatch = JsonFenceRegex().Match(text);
         if (fenceMatch.Success)
         {
             return fenceMatch.Groups[1].Value;
@@ -497,4 +497,7 @@ public sealed class ExecutionPlanParser
 
         return text[start..(end + 1)];
     }
+
+    [GeneratedRegex(@"```(?:json)?\s*\n?(\{[\s\S]*?\})\s*```", RegexOptions.IgnoreCase | RegexOptions.NonBacktracking)]
+    private static partial Regex JsonFenceRegex();
 }
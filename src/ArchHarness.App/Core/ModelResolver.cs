@@ -15,6 +15,8 @@ public sealed class ModelResolver : IModelResolver
     private readonly AgentsOptions _agents;
     private readonly CopilotOptions _copilot;
     private readonly IDiscoveredModelCatalog _catalog;
+    private readonly Dictionary<string, string> _roleModels;
+    private readonly HashSet<string> _configuredModels;
 
     public ModelResolver(
         IOptions<AgentsOptions> agentOptions,
@@ -24,6 +26,18 @@ public sealed class ModelResolver : IModelResolver
         _agents = agentOptions.Value;
         _copilot = copilotOptions.Value;
         _catalog = catalog;
+
+        // Options are bound once per process, so role defaults and the configured allow-list never change.
+        _roleModels = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase)
+        {
+            ["orchestration"] = _agents.Orchestration.Model,
+            ["frontend"] = _agents.Frontend.Model,
+            ["builder"] = _agents.Builder.Model,
+            ["style"] = _agents.Style.Model,
+            ["architecture"] = _agents.Architecture.Model,
+            ["conversation"] = _copilot.ConversationModel
+        };
+        _configuredModels = new HashSet<string>(_copilot.SupportedModels, StringComparer.OrdinalIgnoreCase);
     }
 
     public IReadOnlyCollection<string> SupportedModels
@@ -37,16 +51,10 @@ public sealed class ModelResolver : IModelResolver
             return overrideModel;
         }
 
-        var model = role.ToLowerInvariant() switch
+        if (!_roleModels.TryGetValue(role, out var model))
         {
-            "orchestration" => _agents.Orchestration.Model,
-            "frontend" => _agents.Frontend.Model,
-            "builder" => _agents.Builder.Model,
-            "style" => _agents.Style.Model,
-            "architecture" => _agents.Architecture.Model,
-            "conversation" => _copilot.ConversationModel,
-            _ => throw new ArgumentOutOfRangeException(nameof(role), $"Unsupported role: {role}")
-        };
+            throw new ArgumentOutOfRangeException(nameof(role), $"Unsupported role: {role}");
+        }
 
         ValidateOrThrow(model);
         return model;
@@ -54,17 +62,20 @@ public sealed class ModelResolver : IModelResolver
 
     public void ValidateOrThrow(string model)
     {
+        // Check membership directly; SupportedModels copies and sorts the discovered catalog on every read.
+        var isSupported = _catalog.HasModels ? _catalog.Contains(model) : _configuredModels.Contains(model);
+        if (isSupported)
+        {
+            return;
+        }
+
         var supported = SupportedModels;
         if (supported.Count == 0)
         {
             throw new InvalidOperationException("No supported models configured.");
         }
 
-        var isSupported = supported.Any(m => string.Equals(m, model, StringComparison.OrdinalIgnoreCase));
-        if (!isSupported)
-        {
-            throw new InvalidOperationException(
-                $"Model '{model}' is not supported by the configured Copilot model allow-list. Supported models: {string.Join(", ", supported)}");
-        }
+        throw new InvalidOperationException(
+            $"Model '{model}' is not supported by the configured Copilot model allow-list. Supported models: {string.Join(", ", supported)}");
     }
 }
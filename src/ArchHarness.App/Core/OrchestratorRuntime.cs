@@ -1,6 +1,7 @@
 using ArchHarness.App.Agents;
 using ArchHarness.App.Copilot;
 using ArchHarness.App.Workspace;
+using Microsoft.Extensions.Logging;
 
 namespace ArchHarness.App.Core;
 
@@ -20,6 +21,7 @@ public sealed class OrchestratorRuntime
     private readonly BuildValidator _buildValidator;
     private readonly RunArtifactWriter _artifactWriter;
     private readonly RunEventLogger _eventLogger;
+    private readonly ILogger<OrchestratorRuntime> _logger;
 
     /// <summary>
     /// Initializes a new instance of the <see cref="OrchestratorRuntime"/> class.
@@ -32,7 +34,8 @@ public sealed class OrchestratorRuntime
         PlanExecutor planExecutor,
         BuildValidator buildValidator,
         RunArtifactWriter artifactWriter,
-        RunEventLogger eventLogger)
+        RunEventLogger eventLogger,
+        ILogger<OrchestratorRuntime> logger)
     {
         _agentDependencies = agentDependencies;
         _copilotClient = copilotClient;
@@ -42,6 +45,7 @@ public sealed class OrchestratorRuntime
         _buildValidator = buildValidator;
         _artifactWriter = artifactWriter;
         _eventLogger = eventLogger;
+        _logger = logger;
     }
 
     /// <summary>
@@ -75,28 +79,31 @@ public sealed class OrchestratorRuntime
 
         try
         {
-            await _eventLogger.AppendEventAsync(runDirectory, new { runId, source = OrchestratorSource, message = "Run started" }, cancellationToken);
-            await _eventLogger.AppendEventAsync(runDirectory, new
+            await _eventLogger.AppendEventsAsync(runDirectory, new object[]
             {
-                runId,
-                source = "request",
-                message = "Run request received",
-                taskPrompt = request.TaskPrompt,
-                workspacePath = request.WorkspacePath,
-                workspaceMode = request.WorkspaceMode,
-                workflow = request.Workflow,
-                projectName = request.ProjectName,
-                buildCommand = request.BuildCommand,
-                modelOverrides = request.ModelOverrides
-            }, cancellationToken);
-            await _eventLogger.AppendEventAsync(runDirectory, new
-            {
-                runId,
-                source = "build-selection",
-                message = "Initial build command selection",
-                buildCommand = request.BuildCommand,
-                inferred = initialBuildSelection.Inferred,
-                reason = initialBuildSelection.Reason
+                new { runId, source = OrchestratorSource, message = "Run started" },
+                new
+                {
+                    runId,
+                    source = "request",
+                    message = "Run request received",
+                    taskPrompt = request.TaskPrompt,
+                    workspacePath = request.WorkspacePath,
+                    workspaceMode = request.WorkspaceMode,
+                    workflow = request.Workflow,
+                    projectName = request.ProjectName,
+                    buildCommand = request.BuildCommand,
+                    modelOverrides = request.ModelOverrides
+                },
+                new
+                {
+                    runId,
+                    source = "build-selection",
+                    message = "Initial build command selection",
+                    buildCommand = request.BuildCommand,
+                    inferred = initialBuildSelection.Inferred,
+                    reason = initialBuildSelection.Reason
+                }
             }, cancellationToken);
             progress?.Report(new RuntimeProgressEvent(DateTimeOffset.UtcNow, OrchestratorSource, "Run started"));
 
@@ -173,12 +180,11 @@ public sealed class OrchestratorRuntime
                 - BuildExecuted: {validation.BuildResult.Executed}
                 - BuildPassed: {validation.BuildResult.Passed}
                 """;
-            await _artifactWriter.WriteFinalSummaryAsync(runDirectory, summary, cancellationToken);
 
             string[] modelOverrides = request.ModelOverrides?.Select(pair => $"{pair.Key}={pair.Value}").ToArray() ?? Array.Empty<string>();
             IReadOnlyList<CopilotModelUsage> usage = _copilotClient.GetUsageSnapshot();
 
-            await _artifactWriter.WriteRunLogAsync(runDirectory, new
+            var runLog = new
             {
                 status = validation.Completed ? "completed" : "incomplete",
                 request.WorkspaceMode,
@@ -193,18 +199,34 @@ public sealed class OrchestratorRuntime
                     new { role = "architecture", model = _agentDependencies.ArchitectureAgent.ResolveModel(request.ModelOverrides) }
                 },
                 copilotUsage = usage
-            }, cancellationToken);
+            };
+
+            // The summary and run log are independent files, so let both writes proceed together.
+            await Task.WhenAll(
+                _artifactWriter.WriteFinalSummaryAsync(runDirectory, summary, cancellationToken),
+                _artifactWriter.WriteRunLogAsync(runDirectory, runLog, cancellationToken));
 
             await _eventLogger.AppendEventAsync(runDirectory, new { runId, source = OrchestratorSource, message = "Run completed" }, cancellationToken);
             progress?.Report(new RuntimeProgressEvent(DateTimeOffset.UtcNow, OrchestratorSource, "Run completed"));
 
-            await sessionEventCts.CancelAsync();
-            await sessionEventPump;
             return new RunArtefacts(runId, runDirectory);
         }
         finally
         {
+            // Stop the session pump on every path before closing the log, so no late event can reopen it.
+            await sessionEventCts.CancelAsync();
+            try
+            {
+                await sessionEventPump;
+            }
+            catch (Exception ex)
+            {
+                // Rethrowing here would replace whatever exception is already unwinding the run.
+                _logger.LogError(ex, "Session event pump faulted for run '{RunId}'.", runId);
+            }
+
             _runContextAccessor.SetCurrent(null);
+            await _eventLogger.CloseAsync(runDirectory);
         }
     }
 
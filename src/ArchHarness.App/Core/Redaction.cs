@@ -11,12 +11,24 @@ public static partial class Redaction
             return text;
         }
 
-        var output = JsonSecretValueRegex().Replace(text, "$1***REDACTED***$3");
-        output = EnvSecretValueRegex().Replace(output, "$1=***REDACTED***");
-        output = GitHubTokenRegex().Replace(output, "***REDACTED***");
-        return output;
+        var output = text;
+        if (ContainsSecretKeyword(text))
+        {
+            output = JsonSecretValueRegex().Replace(output, "$1***REDACTED***$2");
+            output = EnvSecretValueRegex().Replace(output, "$1=***REDACTED***");
+        }
+
+        return GitHubTokenRegex().Replace(output, "***REDACTED***");
     }
 
+    // Nearly no text carries a secret key name, and a vectorized substring scan is far cheaper than the
+    // case-insensitive regexes, whose leading character class matches on almost every word.
+    private static bool ContainsSecretKeyword(string text)
+        => text.Contains("password", StringComparison.OrdinalIgnoreCase)
+            || text.Contains("secret", StringComparison.OrdinalIgnoreCase)
+            || text.Contains("token", StringComparison.OrdinalIgnoreCase)
+            || text.Contains("api", StringComparison.OrdinalIgnoreCase);
+
     [GeneratedRegex(@"(?i)(""(?:password|secret|token|api[_-]?key)""\s*:\s*"")[^""]*("")")]
     private static partial Regex JsonSecretValueRegex();
 
@@ -32,6 +32,24 @@ public sealed class RunEventLogger
     public Task AppendEventAsync(string runDirectory, object eventData, CancellationToken cancellationToken)
         => _artefactStore.AppendEventAsync(runDirectory, eventData, cancellationToken);
 
+    /// <summary>
+    /// Appends several structured events to the run log in one write.
+    /// </summary>
+    /// <param name="runDirectory">The run artefact directory.</param>
+    /// <param name="events">The event payloads to log, in order.</param>
+    /// <param name="cancellationToken">Cancellation token.</param>
+    /// <returns>A task representing the async operation.</returns>
+    public Task AppendEventsAsync(string runDirectory, IReadOnlyList<object> events, CancellationToken cancellationToken)
+        => _artefactStore.AppendEventsAsync(runDirectory, events, cancellationToken);
+
+    /// <summary>
+    /// Flushes and releases the run's event log once no further events are expected.
+    /// </summary>
+    /// <param name="runDirectory">The run artefact directory.</param>
+    /// <returns>A task representing the async operation.</returns>
+    public Task CloseAsync(string runDirectory)
+        => _artefactStore.CloseEventLogAsync(runDirectory);
+
     /// <summary>
     /// Continuously reads Copilot session events and persists them to the run log
     /// until cancellation is requested.
@@ -157,17 +157,20 @@ public static class ShadowRuntimeBootstrap
         }
 
         DateTimeOffset staleThreshold = DateTimeOffset.UtcNow.AddDays(-2);
-        foreach (string directory in Directory.GetDirectories(shadowRoot, "run-*", SearchOption.TopDirectoryOnly))
+
+        // DirectoryInfo entries carry the timestamps read during enumeration, so checking staleness does not
+        // cost a second metadata lookup per run directory.
+        foreach (DirectoryInfo directory in new DirectoryInfo(shadowRoot).EnumerateDirectories("run-*", SearchOption.TopDirectoryOnly))
         {
             try
             {
-                DateTimeOffset lastWriteUtc = new DateTimeOffset(Directory.GetLastWriteTimeUtc(directory));
+                DateTimeOffset lastWriteUtc = new DateTimeOffset(directory.LastWriteTimeUtc);
                 if (lastWriteUtc >= staleThreshold)
                 {
                     continue;
                 }
 
-                Directory.Delete(directory, recursive: true);
+                directory.Delete(recursive: true);
             }
             catch
             {
@@ -6,7 +6,7 @@ namespace ArchHarness.App.Core;
 /// Provides workspace-aware analysis utilities for language detection, objective path enforcement,
 /// and classification of step objectives as review-type work.
 /// </summary>
-public sealed class WorkspaceContextAnalyzer : IWorkspaceContextAnalyzer
+public sealed partial class WorkspaceContextAnalyzer : IWorkspaceContextAnalyzer
 {
     /// <summary>
     /// Detects which programming languages are present in the workspace by scanning for
@@ -18,14 +18,14 @@ public sealed class WorkspaceContextAnalyzer : IWorkspaceContextAnalyzer
     {
         List<string> output = new List<string>();
 
-        bool hasDotnet = Directory.GetFiles(workspaceRoot, "*.csproj", SearchOption.AllDirectories).Length > 0
-            || Directory.GetFiles(workspaceRoot, "*.cs", SearchOption.AllDirectories).Length > 0;
+        bool hasDotnet = Directory.EnumerateFiles(workspaceRoot, "*.csproj", SearchOption.AllDirectories).Any()
+            || Directory.EnumerateFiles(workspaceRoot, "*.cs", SearchOption.AllDirectories).Any();
         if (hasDotnet)
         {
             output.Add("dotnet");
         }
 
-        bool hasVue = Directory.GetFiles(workspaceRoot, "*.vue", SearchOption.AllDirectories).Length > 0
+        bool hasVue = Directory.EnumerateFiles(workspaceRoot, "*.vue", SearchOption.AllDirectories).Any()
             || File.Exists(Path.Combine(workspaceRoot, "package.json"));
         if (hasVue)
         {
@@ -49,15 +49,16 @@ public sealed class WorkspaceContextAnalyzer : IWorkspaceContextAnalyzer
     /// <returns>The objective with out-of-workspace paths replaced.</returns>
     public string EnforceWorkspaceRootInObjective(string objective, string workspaceRoot)
     {
-        if (string.IsNullOrWhiteSpace(objective))
+        // Every drive-rooted path contains a colon and backslash pair, and most objectives carry none, so a
+        // vectorized substring check lets them skip both the regex scan and normalizing the workspace root.
+        if (string.IsNullOrWhiteSpace(objective) || !objective.Contains(":\\", StringComparison.Ordinal))
         {
             return objective;
         }
 
         string normalizedRoot = Path.GetFullPath(workspaceRoot).TrimEnd('\\', '/');
-        const string WINDOWS_PATH_PATTERN = "(?<![A-Za-z0-9_])([A-Za-z]:\\\\[^\\s\\\"']+)";
 
-        return Regex.Replace(objective, WINDOWS_PATH_PATTERN, match =>
+        return WindowsPathRegex().Replace(objective, match =>
         {
             string originalPath = match.Groups[1].Value;
             try
@@ -90,25 +91,27 @@ public sealed class WorkspaceContextAnalyzer : IWorkspaceContextAnalyzer
             return false;
         }
 
-        string text = objective.ToLowerInvariant();
-        bool looksLikeDesign = text.Contains("design")
-            || text.Contains("spec")
-            || text.Contains("concept")
-            || text.Contains("define")
-            || text.Contains("namespace layout")
-            || text.Contains("project structure");
+        bool looksLikeDesign = objective.Contains("design", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("spec", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("concept", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("define", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("namespace layout", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("project structure", StringComparison.OrdinalIgnoreCase);
 
         if (looksLikeDesign)
         {
             return false;
         }
 
-        bool looksLikeReview = text.Contains("review")
-            || text.Contains("verify")
-            || text.Contains("enforce")
-            || text.Contains("validate")
-            || text.Contains("audit");
+        bool looksLikeReview = objective.Contains("review", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("verify", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("enforce", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("validate", StringComparison.OrdinalIgnoreCase)
+            || objective.Contains("audit", StringComparison.OrdinalIgnoreCase);
 
         return looksLikeReview;
     }
+
+    [GeneratedRegex("(?<![A-Za-z0-9_])([A-Za-z]:\\\\[^\\s\\\"']+)")]
+    private static partial Regex WindowsPathRegex();
 }
@@ -1,30 +1,66 @@
+using System.IO.Enumeration;
+using System.Text.RegularExpressions;
+
 namespace ArchHarness.App.Core;
 
 /// <summary>
 /// Provides workspace file snapshot and change-detection utilities shared across agents.
 /// </summary>
-internal static class WorkspaceSnapshotHelper
+internal static partial class WorkspaceSnapshotHelper
 {
+    private const string RUN_ARTEFACTS_DIRECTORY = ".agent-harness";
+
+    // Unlike the SearchOption overloads, EnumerationOptions skips unreadable directories instead of throwing.
+    private static readonly EnumerationOptions SnapshotEnumerationOptions = new EnumerationOptions
+    {
+        RecurseSubdirectories = true,
+        IgnoreInaccessible = true,
+        AttributesToSkip = 0
+    };
+
     /// <summary>
     /// Captures a snapshot of all non-ignored files in the workspace, keyed by relative path.
     /// </summary>
     /// <param name="workspaceRoot">The root directory of the workspace.</param>
+    /// <param name="capacity">Expected number of files, used to pre-size the snapshot.</param>
     /// <returns>A dictionary mapping relative paths to their size and last-write timestamps.</returns>
-    public static Dictionary<string, (long Length, long LastWriteUtcTicks)> CaptureSnapshot(string workspaceRoot)
+    public static Dictionary<string, (long Length, long LastWriteUtcTicks)> CaptureSnapshot(string workspaceRoot, int capacity = 0)
     {
-        Dictionary<string, (long Length, long LastWriteUtcTicks)> snapshot = new Dictionary<string, (long Length, long LastWriteUtcTicks)>(StringComparer.OrdinalIgnoreCase);
-        foreach (string fullPath in Directory
-                     .GetFiles(workspaceRoot, "*", SearchOption.AllDirectories)
-                     .Where(fullPath => !IsIgnoredPath(Path.GetRelativePath(workspaceRoot, fullPath))))
+        Dictionary<string, (long Length, long LastWriteUtcTicks)> snapshot = new Dictionary<string, (long Length, long LastWriteUtcTicks)>(capacity, StringComparer.OrdinalIgnoreCase);
+        foreach ((string relativePath, long length, long lastWriteUtcTicks) in EnumerateFiles(workspaceRoot))
         {
-            string relativePath = Path.GetRelativePath(workspaceRoot, fullPath);
-            FileInfo info = new FileInfo(fullPath);
-            snapshot[relativePath] = (info.Length, info.LastWriteTimeUtc.Ticks);
+            snapshot[relativePath] = (length, lastWriteUtcTicks);
         }
 
         return snapshot;
     }
 
+    /// <summary>
+    /// Streams the non-ignored files under the workspace root with their size and last-write timestamp.
+    /// Ignored directories are pruned before descent, so their contents are never enumerated.
+    /// </summary>
+    /// <param name="workspaceRoot">The root directory of the workspace.</param>
+    /// <returns>Relative path, length and last-write ticks for each file.</returns>
+    public static IEnumerable<(string RelativePath, long Length, long LastWriteUtcTicks)> EnumerateFiles(string workspaceRoot)
+    {
+        string root = Path.GetFullPath(workspaceRoot);
+        return EnumerateWorkspace(
+            root,
+            (ref FileSystemEntry entry) => (
+                Path.GetRelativePath(root, entry.ToFullPath()),
+                entry.Length,
+                entry.LastWriteTimeUtc.UtcTicks));
+    }
+
+    /// <summary>
+    /// Streams the full paths of non-ignored files under the workspace root, pruning ignored directories
+    /// the same way as <see cref="EnumerateFiles"/>.
+    /// </summary>
+    /// <param name="workspaceRoot">The root directory of the workspace.</param>
+    /// <returns>The full path of each file.</returns>
+    public static IEnumerable<string> EnumerateFilePaths(string workspaceRoot)
+        => EnumerateWorkspace(Path.GetFullPath(workspaceRoot), (ref FileSystemEntry entry) => entry.ToFullPath());
+
     /// <summary>
     /// Compares the current workspace state against a baseline snapshot and returns changed file paths.
     /// </summary>
@@ -35,27 +71,27 @@ internal static class WorkspaceSnapshotHelper
         string workspaceRoot,
         IReadOnlyDictionary<string, (long Length, long LastWriteUtcTicks)> baseline)
     {
-        Dictionary<string, (long Length, long LastWriteUtcTicks)> current = CaptureSnapshot(workspaceRoot);
-        HashSet<string> changed = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
-
-        foreach (string currentPath in current.Keys.Where(p => !baseline.ContainsKey(p)))
-        {
-            changed.Add(currentPath);
-        }
+        Dictionary<string, (long Length, long LastWriteUtcTicks)> current = CaptureSnapshot(workspaceRoot, baseline.Count);
+        List<string> changed = new List<string>();
 
-        foreach (KeyValuePair<string, (long Length, long LastWriteUtcTicks)> entry in current
-                     .Where(entry => baseline.TryGetValue(entry.Key, out (long Length, long LastWriteUtcTicks) baselineSignature)
-                                     && baselineSignature != entry.Value))
+        foreach (KeyValuePair<string, (long Length, long LastWriteUtcTicks)> entry in current)
         {
-            changed.Add(entry.Key);
+            if (!baseline.TryGetValue(entry.Key, out (long Length, long LastWriteUtcTicks) baselineSignature)
+                || baselineSignature != entry.Value)
+            {
+                changed.Add(entry.Key);
+            }
         }
 
-        foreach (string baselinePath in baseline.Keys.Where(p => !current.ContainsKey(p)))
+        foreach (string baselinePath in baseline.Keys)
         {
-            changed.Add(baselinePath);
+            if (!current.ContainsKey(baselinePath))
+            {
+                changed.Add(baselinePath);
+            }
         }
 
-        return changed.ToArray();
+        return changed;
     }
 
     /// <summary>
@@ -64,12 +100,30 @@ internal static class WorkspaceSnapshotHelper
     /// <param name="relativePath">The relative path to check.</param>
     /// <returns><c>true</c> if the path should be ignored; otherwise <c>false</c>.</returns>
     public static bool IsIgnoredPath(string relativePath)
+        => IgnoredPathRegex().IsMatch(relativePath);
+
+    private static FileSystemEnumerable<T> EnumerateWorkspace<T>(string root, FileSystemEnumerable<T>.FindTransform transform)
+        => new FileSystemEnumerable<T>(root, transform, SnapshotEnumerationOptions)
+        {
+            ShouldIncludePredicate = (ref FileSystemEntry entry) => !entry.IsDirectory,
+            ShouldRecursePredicate = (ref FileSystemEntry entry) => !IsIgnoredDirectory(ref entry)
+        };
+
+    private static bool IsIgnoredDirectory(ref FileSystemEntry entry)
     {
-        string normalized = relativePath.Replace('\\', '/');
-        return normalized.StartsWith(".git/", StringComparison.OrdinalIgnoreCase)
-            || normalized.Contains("/bin/", StringComparison.OrdinalIgnoreCase)
-            || normalized.Contains("/obj/", StringComparison.OrdinalIgnoreCase)
-            || normalized.StartsWith("bin/", StringComparison.OrdinalIgnoreCase)
-            || normalized.StartsWith("obj/", StringComparison.OrdinalIgnoreCase);
+        ReadOnlySpan<char> name = entry.FileName;
+        if (name.Equals("bin", StringComparison.OrdinalIgnoreCase) || name.Equals("obj", StringComparison.OrdinalIgnoreCase))
+        {
+            return true;
+        }
+
+        bool atRoot = entry.Directory.Length == entry.RootDirectory.Length;
+        return atRoot
+            && (name.Equals(".git", StringComparison.OrdinalIgnoreCase)
+                || name.Equals(RUN_ARTEFACTS_DIRECTORY, StringComparison.OrdinalIgnoreCase));
     }
+
+    // Mirrors IsIgnoredDirectory for callers holding a path; accepts either separator so callers need not normalize.
+    [GeneratedRegex(@"^(?:\.git|\.agent-harness)[\\/]|(?:^|[\\/])(?:bin|obj)[\\/]", RegexOptions.IgnoreCase | RegexOptions.CultureInvariant)]
+    private static partial Regex IgnoredPathRegex();
 }
@@ -3,6 +3,7 @@ using ArchHarness.App.Copilot;
 using ArchHarness.App.Core;
 using ArchHarness.App.Storage;
 using ArchHarness.App.Tui;
+using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Hosting;
 
@@ -11,7 +12,10 @@ if (ShadowRuntimeBootstrap.TryRelaunchFromShadowCopy(args))
     return;
 }
 
-var builder = Host.CreateApplicationBuilder(args);
+// Options are read once per process, so skip the file watchers the default host sets up for appsettings.
+var hostConfiguration = new ConfigurationManager();
+hostConfiguration.AddInMemoryCollection(new Dictionary<string, string?> { ["hostBuilder:reloadConfigOnChange"] = "false" });
+var builder = Host.CreateApplicationBuilder(new HostApplicationBuilderSettings { Args = args, Configuration = hostConfiguration });
 
 builder.Services.Configure<AgentsOptions>(builder.Configuration.GetSection("agents"));
 builder.Services.Configure<CopilotOptions>(builder.Configuration.GetSection("copilot"));
@@ -1,3 +1,4 @@
+using System.Text;
 using System.Text.Json;
 using ArchHarness.App.Core;
 
@@ -47,20 +48,40 @@ public interface IArtefactStore
     /// <param name="evt">The event object to serialize and append.</param>
     /// <param name="cancellationToken">Token to signal cancellation.</param>
     Task AppendEventAsync(string runDirectory, object evt, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Appends several events as JSONL lines to the run events log with a single flush.
+    /// </summary>
+    /// <param name="runDirectory">The run output directory.</param>
+    /// <param name="events">The event objects to serialize and append, in order.</param>
+    /// <param name="cancellationToken">Token to signal cancellation.</param>
+    Task AppendEventsAsync(string runDirectory, IReadOnlyList<object> events, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Flushes and releases the events log held open for the run directory, if any.
+    /// Events appended for the run after this are written without holding the log open again.
+    /// </summary>
+    /// <param name="runDirectory">The run output directory.</param>
+    Task CloseEventLogAsync(string runDirectory);
 }
 
 /// <summary>
 /// File-system-backed artefact store that persists run outputs as JSON and JSONL files.
 /// </summary>
-public sealed class ArtefactStore : IArtefactStore
+public sealed class ArtefactStore : IArtefactStore, IDisposable
 {
+    private readonly SemaphoreSlim _eventLogLock = new SemaphoreSlim(1, 1);
+    private readonly HashSet<string> _closedEventLogDirectories = new HashSet<string>(StringComparer.Ordinal);
+    private string? _eventLogDirectory;
+    private FileStream? _eventLogStream;
+
     /// <inheritdoc />
     public Task WriteExecutionPlanAsync(string runDirectory, ExecutionPlan plan, CancellationToken cancellationToken)
-        => File.WriteAllTextAsync(Path.Combine(runDirectory, "ExecutionPlan.json"), JsonSerializer.Serialize(plan, JsonDefaults.Indented), cancellationToken);
+        => File.WriteAllBytesAsync(Path.Combine(runDirectory, "ExecutionPlan.json"), JsonSerializer.SerializeToUtf8Bytes(plan, ArtefactJsonContext.Default.ExecutionPlan), cancellationToken);
 
     /// <inheritdoc />
     public Task WriteArchitectureReviewAsync(string runDirectory, ArchitectureReview review, CancellationToken cancellationToken)
-        => File.WriteAllTextAsync(Path.Combine(runDirectory, "ArchitectureReview.json"), JsonSerializer.Serialize(review, JsonDefaults.Indented), cancellationToken);
+        => File.WriteAllBytesAsync(Path.Combine(runDirectory, "ArchitectureReview.json"), JsonSerializer.SerializeToUtf8Bytes(review, ArtefactJsonContext.Default.ArchitectureReview), cancellationToken);
 
     /// <inheritdoc />
     public Task WriteFinalSummaryAsync(string runDirectory, string summary, CancellationToken cancellationToken)
@@ -74,19 +95,110 @@ public sealed class ArtefactStore : IArtefactStore
             cancellationToken);
 
     /// <inheritdoc />
-    public async Task AppendEventAsync(string runDirectory, object evt, CancellationToken cancellationToken)
+    public Task AppendEventAsync(string runDirectory, object evt, CancellationToken cancellationToken)
+        => AppendEventLinesAsync(runDirectory, Redaction.RedactSecrets(JsonSerializer.Serialize(evt)) + Environment.NewLine, cancellationToken);
+
+    /// <inheritdoc />
+    public Task AppendEventsAsync(string runDirectory, IReadOnlyList<object> events, CancellationToken cancellationToken)
     {
-        string line = Redaction.RedactSecrets(JsonSerializer.Serialize(evt));
-        string eventsPath = Path.Combine(runDirectory, "events.jsonl");
-        await using FileStream stream = new FileStream(
-            eventsPath,
+        if (events.Count == 0)
+        {
+            return Task.CompletedTask;
+        }
+
+        StringBuilder lines = new StringBuilder();
+        foreach (object evt in events)
+        {
+            lines.Append(Redaction.RedactSecrets(JsonSerializer.Serialize(evt))).Append(Environment.NewLine);
+        }
+
+        return AppendEventLinesAsync(runDirectory, lines.ToString(), cancellationToken);
+    }
+
+    /// <inheritdoc />
+    public async Task CloseEventLogAsync(string runDirectory)
+    {
+        await _eventLogLock.WaitAsync();
+        try
+        {
+            if (string.Equals(_eventLogDirectory, runDirectory, StringComparison.Ordinal))
+            {
+                await ReleaseEventLogStreamAsync();
+            }
+
+            _closedEventLogDirectories.Add(runDirectory);
+        }
+        finally
+        {
+            _eventLogLock.Release();
+        }
+    }
+
+    /// <inheritdoc />
+    public void Dispose()
+    {
+        _eventLogStream?.Dispose();
+        _eventLogStream = null;
+        _eventLogLock.Dispose();
+    }
+
+    private async Task AppendEventLinesAsync(string runDirectory, string lines, CancellationToken cancellationToken)
+    {
+        await _eventLogLock.WaitAsync(cancellationToken);
+        try
+        {
+            byte[] bytes = Encoding.UTF8.GetBytes(lines);
+
+            // A closed run never gets its long-lived handle back; a straggling event is appended and the
+            // file released straight away, so the handle cannot outlive the run.
+            if (_closedEventLogDirectories.Contains(runDirectory))
+            {
+                await using FileStream oneShot = OpenEventLog(runDirectory);
+                await oneShot.WriteAsync(bytes, cancellationToken);
+                return;
+            }
+
+            // The stream is unbuffered, so each append is one write straight to the OS and the Logs screen
+            // sees it immediately without a separate flush.
+            FileStream stream = await GetEventLogStreamAsync(runDirectory);
+            await stream.WriteAsync(bytes, cancellationToken);
+        }
+        finally
+        {
+            _eventLogLock.Release();
+        }
+    }
+
+    private async Task<FileStream> GetEventLogStreamAsync(string runDirectory)
+    {
+        if (_eventLogStream is not null && string.Equals(_eventLogDirectory, runDirectory, StringComparison.Ordinal))
+        {
+            return _eventLogStream;
+        }
+
+        await ReleaseEventLogStreamAsync();
+        _eventLogStream = OpenEventLog(runDirectory);
+        _eventLogDirectory = runDirectory;
+        return _eventLogStream;
+    }
+
+    private static FileStream OpenEventLog(string runDirectory)
+        => new FileStream(
+            Path.Combine(runDirectory, "events.jsonl"),
             FileMode.Append,
             FileAccess.Write,
             FileShare.ReadWrite,
-            4096,
-            FileOptions.Asynchronous | FileOptions.WriteThrough);
-        await using StreamWriter writer = new StreamWriter(stream);
-        await writer.WriteLineAsync(line.AsMemory(), cancellationToken);
-        await writer.FlushAsync(cancellationToken);
+            bufferSize: 0,
+            FileOptions.Asynchronous);
+
+    private async Task ReleaseEventLogStreamAsync()
+    {
+        if (_eventLogStream is not null)
+        {
+            await _eventLogStream.DisposeAsync();
+        }
+
+        _eventLogStream = null;
+        _eventLogDirectory = null;
     }
 }
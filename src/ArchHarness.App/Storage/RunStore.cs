@@ -22,7 +22,8 @@ public sealed class RunStore : IRunStore
 
     public Task WriteRunLogAsync(string runDirectory, object payload, CancellationToken cancellationToken)
     {
-        var serialized = JsonSerializer.Serialize(payload, JsonDefaults.Indented);
+        // run-log.json is read by tooling rather than shown in the TUI, so skip the indentation whitespace.
+        var serialized = JsonSerializer.Serialize(payload);
         var redacted = Redaction.RedactSecrets(serialized);
         return File.WriteAllTextAsync(Path.Combine(runDirectory, "run-log.json"), redacted, cancellationToken);
     }
@@ -50,6 +50,8 @@ public sealed class AgentStreamState
     private readonly IAgentStreamEventStream _eventStream;
     private readonly List<AgentStreamDeltaEvent> _events = new List<AgentStreamDeltaEvent>();
     private readonly IAgentStreamAccumulator _accumulator;
+    private readonly List<(string Id, string Role)> _agents = new List<(string Id, string Role)>();
+    private int _indexedEventCount;
     private string? _selectedAgentId;
 
     /// <summary>
@@ -80,11 +82,8 @@ public sealed class AgentStreamState
     {
         lock (this._events)
         {
-            return this._events
-                .Select(e => (e.AgentId, e.AgentRole))
-                .Distinct()
-                .OrderBy(a => a.AgentId)
-                .ToList();
+            this.IndexNewAgents();
+            return this._agents.ToList();
         }
     }
 
@@ -96,11 +95,8 @@ public sealed class AgentStreamState
         List<string> agentIds;
         lock (this._events)
         {
-            agentIds = this._events
-                .Select(e => e.AgentId)
-                .Distinct()
-                .OrderBy(id => id)
-                .ToList();
+            this.IndexNewAgents();
+            agentIds = this._agents.Select(a => a.Id).Distinct().ToList();
         }
 
         if (agentIds.Count > 0)
@@ -128,4 +124,28 @@ public sealed class AgentStreamState
             // Expected on run shutdown when stopping the agent stream pump.
         }
     }
+
+    private void IndexNewAgents()
+    {
+        // The selector is redrawn every frame while deltas pile up by the thousand, but the agent set
+        // only grows, so fold in just the events added since the last call instead of rescanning them all.
+        for (; this._indexedEventCount < this._events.Count; this._indexedEventCount++)
+        {
+            AgentStreamDeltaEvent evt = this._events[this._indexedEventCount];
+            (string Id, string Role) agent = (evt.AgentId, evt.AgentRole);
+            if (this._agents.Contains(agent))
+            {
+                continue;
+            }
+
+            // Insert after any agent with an equal or lower ID to keep the stable ordering OrderBy gave.
+            int index = this._agents.Count;
+            while (index > 0 && Comparer<string>.Default.Compare(this._agents[index - 1].Id, agent.Id) > 0)
+            {
+                index--;
+            }
+
+            this._agents.Insert(index, agent);
+        }
+    }
 }
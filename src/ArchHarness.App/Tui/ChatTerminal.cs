@@ -97,13 +97,7 @@ public sealed class ChatTerminal
         Console.CursorVisible = false;
 
         List<RuntimeProgressEvent> runEvents = new List<RuntimeProgressEvent>();
-        Progress<RuntimeProgressEvent> progress = new Progress<RuntimeProgressEvent>(evt =>
-        {
-            lock (runEvents)
-            {
-                runEvents.Add(evt);
-            }
-        });
+        RunProgressCollector progress = new RunProgressCollector(runEvents);
 
         AgentStreamState agentStreamState = new AgentStreamState(this._agentStreamEventStream);
         using CancellationTokenSource agentStreamCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
@@ -112,6 +106,7 @@ public sealed class ChatTerminal
         Task<RunArtefacts> runTask = this._runtime.RunAsync(request, progress, cancellationToken);
         char[] spinner = new[] { '|', '/', '-', '\\' };
         int spinnerIndex = 0;
+        LiveScreenBuffer liveScreen = new LiveScreenBuffer();
         bool liveScreenInitialized = false;
         bool awaitingInputBannerShown = false;
 
@@ -126,7 +121,13 @@ public sealed class ChatTerminal
                     liveScreenInitialized = false;
                 }
 
-                await Task.Delay(140, cancellationToken);
+                // Sleep until the question is answered (or the run ends) instead of polling the flag.
+                Task answered = this._userInputState.WaitForAnswerAsync(cancellationToken);
+                if (await Task.WhenAny(runTask, answered) == answered)
+                {
+                    await answered;
+                }
+
                 continue;
             }
 
@@ -156,10 +157,11 @@ public sealed class ChatTerminal
                 agentStreamState.SelectedAgentId,
                 availableAgents,
                 spinner[spinnerIndex],
+                liveScreen,
                 ref liveScreenInitialized);
 
             spinnerIndex = (spinnerIndex + 1) % spinner.Length;
-            await Task.Delay(160, cancellationToken);
+            await WaitForNextFrameAsync(runTask, 160, cancellationToken);
         }
 
         await agentStreamCts.CancelAsync();
@@ -238,6 +240,16 @@ public sealed class ChatTerminal
         }
     }
 
+    private static async Task WaitForNextFrameAsync(Task runTask, int frameDelayMilliseconds, CancellationToken cancellationToken)
+    {
+        // Wake as soon as the run finishes instead of sleeping out the rest of the frame.
+        Task frameDelay = Task.Delay(frameDelayMilliseconds, cancellationToken);
+        if (await Task.WhenAny(runTask, frameDelay) == frameDelay)
+        {
+            await frameDelay;
+        }
+    }
+
     private static bool TryReadKey(out ConsoleKeyInfo keyInfo)
     {
         keyInfo = default;
@@ -7,6 +7,8 @@ namespace ArchHarness.App.Tui;
 /// </summary>
 public static class ContentScreenRenderer
 {
+    private static readonly Dictionary<string, CachedFileTail> FileTailCache = new Dictionary<string, CachedFileTail>(StringComparer.Ordinal);
+
     /// <summary>
     /// Renders the startup splash screen with the ASCII art banner.
     /// </summary>
@@ -109,16 +111,94 @@ public static class ContentScreenRenderer
         ChatTerminalRenderer.WriteMuted($"  {path}");
         Console.WriteLine();
 
-        if (!File.Exists(path))
+        FileInfo info = new FileInfo(path);
+        if (!info.Exists)
         {
             ChatTerminalRenderer.WriteColored("  File not found.", ConsoleColor.Yellow);
             Console.WriteLine();
             return;
         }
 
-        foreach (string line in File.ReadLines(path).TakeLast(maxLines))
+        foreach (string line in GetFileTail(info, maxLines))
         {
             Console.WriteLine(line);
         }
     }
+
+    private static IReadOnlyList<string> GetFileTail(FileInfo info, int maxLines)
+    {
+        // Users flip between screens after a run while the files stay put, so only re-read once they change.
+        long lastWriteUtcTicks = info.LastWriteTimeUtc.Ticks;
+        if (FileTailCache.TryGetValue(info.FullName, out CachedFileTail? cached)
+            && cached.Length == info.Length
+            && cached.LastWriteUtcTicks == lastWriteUtcTicks
+            && cached.MaxLines == maxLines)
+        {
+            return cached.Lines;
+        }
+
+        string[] lines = ReadTailLines(info.FullName, maxLines);
+        FileTailCache[info.FullName] = new CachedFileTail(info.Length, lastWriteUtcTicks, maxLines, lines);
+        return lines;
+    }
+
+    /// <summary>
+    /// Reads the last <paramref name="maxLines"/> lines of a file, matching <c>File.ReadLines(path).TakeLast(maxLines)</c>.
+    /// </summary>
+    /// <param name="path">The path to the file to read.</param>
+    /// <param name="maxLines">The maximum number of lines to return.</param>
+    /// <returns>The trailing lines of the file, oldest first.</returns>
+    internal static string[] ReadTailLines(string path, int maxLines)
+    {
+        if (maxLines <= 0)
+        {
+            return Array.Empty<string>();
+        }
+
+        using FileStream stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete);
+
+        // Walk back from the end to the start of the last maxLines lines so only the tail is ever decoded.
+        // UTF-8 never uses the newline byte inside a multi-byte sequence, so scanning raw bytes is safe.
+        long length = stream.Length;
+        long tailStart = 0;
+        long position = length;
+        int newlines = 0;
+        byte[] buffer = new byte[4096];
+        while (position > 0 && tailStart == 0)
+        {
+            int count = (int)Math.Min(buffer.Length, position);
+            position -= count;
+            stream.Position = position;
+            stream.ReadExactly(buffer, 0, count);
+            for (int i = count - 1; i >= 0; i--)
+            {
+                // A newline terminating the final line does not start another line.
+                if (buffer[i] != (byte)'\n' || position + i == length - 1)
+                {
+                    continue;
+                }
+
+                if (++newlines == maxLines)
+                {
+                    tailStart = position + i + 1;
+                    break;
+                }
+            }
+        }
+
+        stream.Position = tailStart;
+        using StreamReader reader = new StreamReader(stream);
+        List<string> lines = new List<string>(maxLines);
+        while (reader.ReadLine() is { } line)
+        {
+            lines.Add(line);
+        }
+
+        // ReadLine also breaks on a lone '\r', which the byte scan does not count, so trim any excess.
+        return lines.Count > maxLines
+            ? lines.GetRange(lines.Count - maxLines, maxLines).ToArray()
+            : lines.ToArray();
+    }
+
+    private sealed record CachedFileTail(long Length, long LastWriteUtcTicks, int MaxLines, string[] Lines);
 }
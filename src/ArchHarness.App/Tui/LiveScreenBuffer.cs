@@ -0,0 +1,85 @@
+namespace ArchHarness.App.Tui;
+
+/// <summary>
+/// Remembers which live monitor rows are already on screen so unchanged rows can be skipped between frames.
+/// One instance belongs to one live monitor session; anything written to the console outside the monitor
+/// invalidates it, so the cache is dropped whenever the cursor is not where the last frame left it, and
+/// a full repaint is forced periodically as a backstop.
+/// </summary>
+public sealed class LiveScreenBuffer
+{
+    private const int FULL_REPAINT_INTERVAL = 25;
+
+    private readonly List<(string Text, ConsoleColor Color)> _rows = new List<(string Text, ConsoleColor Color)>();
+    private (int Width, int Height) _size;
+    private (int Left, int Top)? _cursorAfterFrame;
+    private int _framesSinceFullRepaint;
+
+    /// <summary>
+    /// Forgets every remembered row so the next frame repaints all of them.
+    /// </summary>
+    public void Invalidate()
+    {
+        this._rows.Clear();
+        this._cursorAfterFrame = null;
+        this._framesSinceFullRepaint = 0;
+    }
+
+    /// <summary>
+    /// Starts a frame, dropping remembered rows if the window was resized, the cursor moved since the
+    /// previous frame ended, or the periodic full repaint is due.
+    /// </summary>
+    /// <param name="width">The rendered row width.</param>
+    /// <param name="height">The console window height.</param>
+    /// <param name="cursor">The cursor position before anything is drawn.</param>
+    public void BeginFrame(int width, int height, (int Left, int Top) cursor)
+    {
+        bool resized = (width, height) != this._size;
+        bool cursorMoved = this._cursorAfterFrame is { } expected && expected != cursor;
+        if (resized || cursorMoved || this._framesSinceFullRepaint >= FULL_REPAINT_INTERVAL)
+        {
+            this.Invalidate();
+            this._size = (width, height);
+        }
+
+        this._framesSinceFullRepaint++;
+    }
+
+    /// <summary>
+    /// Records the row about to be shown at <paramref name="index"/> and reports whether it must be written.
+    /// </summary>
+    /// <param name="index">The zero-based screen row.</param>
+    /// <param name="text">The row text, already truncated to the frame width.</param>
+    /// <param name="color">The row foreground colour.</param>
+    /// <returns><c>true</c> if the row differs from what is on screen; otherwise <c>false</c>.</returns>
+    public bool ShouldWriteRow(int index, string text, ConsoleColor color)
+    {
+        if (index < this._rows.Count)
+        {
+            if (this._rows[index] == (text, color))
+            {
+                return false;
+            }
+
+            this._rows[index] = (text, color);
+            return true;
+        }
+
+        // Rows are drawn top to bottom, so a new row always extends the remembered ones by one.
+        if (index == this._rows.Count)
+        {
+            this._rows.Add((text, color));
+        }
+
+        return true;
+    }
+
+    /// <summary>
+    /// Ends a frame, remembering where the cursor was left so foreign console output can be detected.
+    /// </summary>
+    /// <param name="cursor">The cursor position after the frame was drawn.</param>
+    public void EndFrame((int Left, int Top) cursor)
+    {
+        this._cursorAfterFrame = cursor;
+    }
+}
@@ -26,8 +26,9 @@ public static class RunMonitor
     /// </summary>
     /// <param name="events">The thread-safe list of progress events.</param>
     /// <param name="spinner">The current spinner character.</param>
+    /// <param name="screen">The rows already on screen for this live monitor session.</param>
     /// <param name="initialized">Tracks whether the console has been cleared for the first frame.</param>
-    public static void RenderLive(List<RuntimeProgressEvent> events, char spinner, ref bool initialized)
+    public static void RenderLive(List<RuntimeProgressEvent> events, char spinner, LiveScreenBuffer screen, ref bool initialized)
     {
         string phase = SPINNER_PHASE_MAP.GetValueOrDefault(spinner, "Finalizing");
 
@@ -64,25 +65,17 @@ public static class RunMonitor
         if (!initialized)
         {
             Console.Clear();
+            screen.Invalidate();
             initialized = true;
         }
 
         int width = Math.Max(20, Console.WindowWidth - 1);
         int maxRenderableRows = Math.Min(rows.Count, Math.Max(1, Console.WindowHeight - 1));
-        for (int i = 0; i < maxRenderableRows; i++)
-        {
-            Console.SetCursorPosition(0, i);
-            (string text, ConsoleColor color) = rows[i];
-            if (text.Length > width)
-            {
-                text = text[..width];
-            }
-
-            Console.ForegroundColor = color;
-            Console.Write(text.PadRight(width));
-        }
+        screen.BeginFrame(width, Console.WindowHeight, Console.GetCursorPosition());
+        WriteChangedRows(screen, rows, maxRenderableRows, width);
 
         Console.ResetColor();
+        screen.EndFrame(Console.GetCursorPosition());
     }
 
     /// <summary>
@@ -94,6 +87,7 @@ public static class RunMonitor
     /// <param name="selectedAgentId">The currently selected agent ID, or null if none selected.</param>
     /// <param name="availableAgents">The available agents to display in the selector.</param>
     /// <param name="spinnerChar">The current spinner character.</param>
+    /// <param name="screen">The rows already on screen for this live monitor session.</param>
     /// <param name="firstRender">Tracks whether the console has been cleared for the first frame.</param>
     public static void RenderLiveWithAgentView(
         List<RuntimeProgressEvent> events,
@@ -101,17 +95,20 @@ public static class RunMonitor
         string? selectedAgentId,
         IEnumerable<(string Id, string Role)> availableAgents,
         char spinnerChar,
+        LiveScreenBuffer screen,
         ref bool firstRender)
     {
         if (!firstRender)
         {
             Console.Clear();
+            screen.Invalidate();
             firstRender = true;
         }
 
         string phase = SPINNER_PHASE_MAP.GetValueOrDefault(spinnerChar, "Finalizing");
         int width = Math.Max(20, Console.WindowWidth - 1);
         int totalRows = Math.Max(10, Console.WindowHeight);
+        screen.BeginFrame(width, Console.WindowHeight, Console.GetCursorPosition());
         int footerRow = totalRows - FOOTER_ROWS;
         int contentRows = footerRow;
         int midRow = contentRows / 2;
@@ -147,18 +144,7 @@ public static class RunMonitor
             topRows.Add((string.Empty, ConsoleColor.Gray));
         }
 
-        for (int i = 0; i < midRow && i < topRows.Count; i++)
-        {
-            Console.SetCursorPosition(0, i);
-            (string text, ConsoleColor color) = topRows[i];
-            if (text.Length > width)
-            {
-                text = text[..width];
-            }
-
-            Console.ForegroundColor = color;
-            Console.Write(text.PadRight(width));
-        }
+        WriteChangedRows(screen, topRows, Math.Min(midRow, topRows.Count), width);
 
         // ── Separator ────────────────────────────────────────────────────────────────
         Console.SetCursorPosition(0, midRow);
@@ -178,6 +164,7 @@ public static class RunMonitor
         }
 
         Console.ResetColor();
+        screen.EndFrame(Console.GetCursorPosition());
     }
 
     /// <summary>
@@ -218,4 +205,27 @@ public static class RunMonitor
             }
         }
     }
+
+    private static void WriteChangedRows(LiveScreenBuffer screen, List<(string Text, ConsoleColor Color)> rows, int rowCount, int width)
+    {
+        // Between frames usually only the spinner row and a few event rows change, and every cursor move,
+        // colour change and write is a separate terminal write, so skip rows already on screen.
+        for (int i = 0; i < rowCount; i++)
+        {
+            (string text, ConsoleColor color) = rows[i];
+            if (text.Length > width)
+            {
+                text = text[..width];
+            }
+
+            if (!screen.ShouldWriteRow(i, text, color))
+            {
+                continue;
+            }
+
+            Console.SetCursorPosition(0, i);
+            Console.ForegroundColor = color;
+            Console.Write(text.PadRight(width));
+        }
+    }
 }
@@ -0,0 +1,34 @@
+using ArchHarness.App.Core;
+
+namespace ArchHarness.App.Tui;
+
+/// <summary>
+/// Progress sink that appends runtime events straight into the shared, lock-guarded monitor list.
+/// </summary>
+/// <remarks>
+/// <see cref="Progress{T}"/> queues a thread-pool callback for every report when no synchronization
+/// context is present, which costs a work item per event and lets events land out of order.
+/// The monitor only needs the list updated, so the append happens inline on the reporting thread.
+/// </remarks>
+internal sealed class RunProgressCollector : IProgress<RuntimeProgressEvent>
+{
+    private readonly List<RuntimeProgressEvent> _events;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="RunProgressCollector"/> class.
+    /// </summary>
+    /// <param name="events">The shared list to append events to.</param>
+    internal RunProgressCollector(List<RuntimeProgressEvent> events)
+    {
+        this._events = events;
+    }
+
+    /// <inheritdoc />
+    public void Report(RuntimeProgressEvent value)
+    {
+        lock (this._events)
+        {
+            this._events.Add(value);
+        }
+    }
+}
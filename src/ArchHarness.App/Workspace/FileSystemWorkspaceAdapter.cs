@@ -1,3 +1,5 @@
+using ArchHarness.App.Core;
+
 namespace ArchHarness.App.Workspace;
 
 public class FileSystemWorkspaceAdapter : IWorkspaceAdapter
@@ -25,7 +27,7 @@ public class FileSystemWorkspaceAdapter : IWorkspaceAdapter
             Directory.CreateDirectory(Path.Combine(RootPath, ".git"));
         }
 
-        _baselineSnapshot = BuildSnapshot();
+        _baselineSnapshot = BuildSnapshot(capacity: 0);
 
         return Task.CompletedTask;
     }
@@ -58,49 +60,57 @@ public class FileSystemWorkspaceAdapter : IWorkspaceAdapter
 
     protected IReadOnlyCollection<string> ComputeChangedPathsSinceBaseline()
     {
-        var currentSnapshot = BuildSnapshot();
-        var changedPaths = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+        // The tree rarely changes size much between scans, so size the table from the baseline.
+        var currentSnapshot = BuildSnapshot(_baselineSnapshot.Count);
+        var changedPaths = new List<string>();
 
-        foreach (var entry in currentSnapshot
-                     .Where(entry => !_baselineSnapshot.TryGetValue(entry.Key, out var baselineSignature)
-                                     || !entry.Value.Equals(baselineSignature)))
+        // Snapshot keys are unique, so one lookup per entry classifies it and no de-duplication is needed.
+        foreach (var entry in currentSnapshot)
         {
-            changedPaths.Add(entry.Key);
+            if (!_baselineSnapshot.TryGetValue(entry.Key, out var baselineSignature) || !entry.Value.Equals(baselineSignature))
+            {
+                changedPaths.Add(entry.Key);
+            }
         }
 
-        foreach (var baselinePath in _baselineSnapshot.Keys.Where(baselinePath => !currentSnapshot.ContainsKey(baselinePath)))
+        foreach (var baselinePath in _baselineSnapshot.Keys)
         {
-            changedPaths.Add(baselinePath);
+            if (!currentSnapshot.ContainsKey(baselinePath))
+            {
+                changedPaths.Add(baselinePath);
+            }
         }
 
         return changedPaths;
     }
 
-    private Dictionary<string, FileSignature> BuildSnapshot()
+    protected IReadOnlyCollection<string> ComputeChangedPathsSinceBaseline(IEnumerable<string> relativePaths)
     {
-        var snapshot = new Dictionary<string, FileSignature>(StringComparer.OrdinalIgnoreCase);
-        foreach (var filePath in Directory
-                     .GetFiles(RootPath, "*", SearchOption.AllDirectories)
-                     .Where(filePath => !IsExcludedPath(filePath)))
+        var changedPaths = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+        foreach (var relativePath in relativePaths)
         {
-            var relativePath = Path.GetRelativePath(RootPath, filePath);
-            var info = new FileInfo(filePath);
-            snapshot[relativePath] = new FileSignature(info.Length, info.LastWriteTimeUtc.Ticks);
+            var snapshotKey = relativePath.Replace('/', Path.DirectorySeparatorChar);
+            var info = new FileInfo(Path.Combine(RootPath, snapshotKey));
+            var inBaseline = _baselineSnapshot.TryGetValue(snapshotKey, out var baselineSignature);
+            if (info.Exists != inBaseline
+                || (info.Exists && !new FileSignature(info.Length, info.LastWriteTimeUtc.Ticks).Equals(baselineSignature)))
+            {
+                changedPaths.Add(relativePath);
+            }
         }
 
-        return snapshot;
+        return changedPaths;
     }
 
-    private bool IsExcludedPath(string fullPath)
+    private Dictionary<string, FileSignature> BuildSnapshot(int capacity)
     {
-        var relativePath = Path.GetRelativePath(RootPath, fullPath);
-        var normalized = relativePath.Replace('\\', '/');
-
-        return normalized.StartsWith(".git/", StringComparison.OrdinalIgnoreCase)
-            || normalized.Contains("/bin/", StringComparison.OrdinalIgnoreCase)
-            || normalized.Contains("/obj/", StringComparison.OrdinalIgnoreCase)
-            || normalized.StartsWith("bin/", StringComparison.OrdinalIgnoreCase)
-            || normalized.StartsWith("obj/", StringComparison.OrdinalIgnoreCase);
+        var snapshot = new Dictionary<string, FileSignature>(capacity, StringComparer.OrdinalIgnoreCase);
+        foreach (var (relativePath, length, lastWriteUtcTicks) in WorkspaceSnapshotHelper.EnumerateFiles(RootPath))
+        {
+            snapshot[relativePath] = new FileSignature(length, lastWriteUtcTicks);
+        }
+
+        return snapshot;
     }
 
     private readonly record struct FileSignature(long Length, long LastWriteUtcTicks);
@@ -1,10 +1,13 @@
 using System.Diagnostics;
+using ArchHarness.App.Core;
 
 namespace ArchHarness.App.Workspace;
 
 public sealed class GitWorkspaceAdapter : FileSystemWorkspaceAdapter
 {
     private HashSet<string> _initialChangedPaths = new(StringComparer.OrdinalIgnoreCase);
+    private string _repositoryPrefix = string.Empty;
+    private string? _baselineHead;
 
     public GitWorkspaceAdapter(string rootPath) : base(rootPath)
     {
@@ -18,17 +21,34 @@ public sealed class GitWorkspaceAdapter : FileSystemWorkspaceAdapter
         }
 
         await base.InitializeAsync(projectName, initGit: true, cancellationToken);
-        _initialChangedPaths = new HashSet<string>(await GetGitChangedPathsAsync(cancellationToken), StringComparer.OrdinalIgnoreCase);
+        _repositoryPrefix = (await RunGitCommandAsync("rev-parse --show-prefix", cancellationToken))?.Trim() ?? string.Empty;
+
+        // A repository without commits has no HEAD; committed changes are then covered by status alone.
+        _baselineHead = (await RunGitCommandAsync("rev-parse --verify HEAD", cancellationToken))?.Trim();
+        _initialChangedPaths = new HashSet<string>(
+            await GetGitChangedPathsAsync(cancellationToken) ?? Array.Empty<string>(),
+            StringComparer.OrdinalIgnoreCase);
     }
 
     public override async Task<string> DiffAsync(CancellationToken cancellationToken)
     {
-        var gitChangedPaths = new HashSet<string>(await GetGitChangedPathsAsync(cancellationToken), StringComparer.OrdinalIgnoreCase);
-        var snapshotChangedPaths = new HashSet<string>(ComputeChangedPathsSinceBaseline(), StringComparer.OrdinalIgnoreCase);
+        var statusPaths = await GetGitChangedPathsAsync(cancellationToken);
+        var committedPaths = await GetCommittedPathsAsync(cancellationToken);
+
+        // If git cannot answer (dubious ownership, corrupt index, not a real repository), an empty
+        // answer would hide every change, so fall back to the full snapshot comparison.
+        if (statusPaths is null || committedPaths is null)
+        {
+            return await base.DiffAsync(cancellationToken);
+        }
 
-        // Exclude files that were already dirty at startup unless they changed since baseline.
+        var gitChangedPaths = new HashSet<string>(statusPaths, StringComparer.OrdinalIgnoreCase);
+        gitChangedPaths.UnionWith(committedPaths);
+
+        // Git already knows what changed; only files that were dirty at startup need a stat against the baseline.
         gitChangedPaths.ExceptWith(_initialChangedPaths);
-        gitChangedPaths.UnionWith(snapshotChangedPaths);
+        gitChangedPaths.UnionWith(ComputeChangedPathsSinceBaseline(_initialChangedPaths));
+        gitChangedPaths.RemoveWhere(WorkspaceSnapshotHelper.IsIgnoredPath);
 
         return string.Join(
             Environment.NewLine,
@@ -36,20 +56,30 @@ public sealed class GitWorkspaceAdapter : FileSystemWorkspaceAdapter
                 .OrderBy(path => path, StringComparer.OrdinalIgnoreCase));
     }
 
-    private async Task<IReadOnlyCollection<string>> GetGitChangedPathsAsync(CancellationToken cancellationToken)
+    private async Task<IReadOnlyCollection<string>?> GetGitChangedPathsAsync(CancellationToken cancellationToken)
     {
-        var changed = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
-
-        var tracked = await RunGitCommandAsync("diff --name-only --relative HEAD", cancellationToken);
-        AddPaths(changed, tracked);
+        // One status call covers staged, unstaged and untracked files; -z keeps paths unquoted.
+        var status = await RunGitCommandAsync("status --porcelain=v1 -z --untracked-files=all -- .", cancellationToken);
+        return status is null ? null : ParsePorcelainPaths(status, _repositoryPrefix);
+    }
 
-        var untracked = await RunGitCommandAsync("ls-files --others --exclude-standard", cancellationToken);
-        AddPaths(changed, untracked);
+    private async Task<IReadOnlyCollection<string>?> GetCommittedPathsAsync(CancellationToken cancellationToken)
+    {
+        if (_baselineHead is null)
+        {
+            return Array.Empty<string>();
+        }
 
-        return changed;
+        // Commits made during the run leave a clean status, so compare the baseline commit with the working tree.
+        var diff = await RunGitCommandAsync($"diff --name-only -z {_baselineHead} -- .", cancellationToken);
+        return diff?
+            .Split('\0', StringSplitOptions.RemoveEmptyEntries)
+            .Select(path => StripPrefix(path, _repositoryPrefix))
+            .ToArray();
     }
 
-    private async Task<string> RunGitCommandAsync(string arguments, CancellationToken cancellationToken)
+    // Returns null on a non-zero exit so callers can tell a failed command from an empty answer.
+    private async Task<string?> RunGitCommandAsync(string arguments, CancellationToken cancellationToken)
     {
         var info = new ProcessStartInfo("git", $"-C {QuoteArgument(RootPath)} {arguments}")
         {
@@ -61,27 +91,56 @@ public sealed class GitWorkspaceAdapter : FileSystemWorkspaceAdapter
 
         using var process = new Process { StartInfo = info };
         process.Start();
-        var stdout = await process.StandardOutput.ReadToEndAsync(cancellationToken);
-        _ = await process.StandardError.ReadToEndAsync(cancellationToken);
-        await process.WaitForExitAsync(cancellationToken);
+        var stdoutTask = process.StandardOutput.ReadToEndAsync(cancellationToken);
+        var stderrTask = process.StandardError.ReadToEndAsync(cancellationToken);
+        await Task.WhenAll(stdoutTask, stderrTask, process.WaitForExitAsync(cancellationToken));
+        var stdout = await stdoutTask;
 
         if (process.ExitCode != 0)
         {
-            return string.Empty;
+            return null;
         }
 
         return stdout;
     }
 
-    private static void AddPaths(ISet<string> output, string raw)
+    public static HashSet<string> ParsePorcelainPaths(string raw, string repositoryPrefix)
     {
-        var lines = raw.Split(new[] { '\r', '\n' }, StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries);
-        foreach (var line in lines.Where(line => !string.IsNullOrWhiteSpace(line)))
+        var changed = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+        var entries = raw.Split('\0', StringSplitOptions.RemoveEmptyEntries);
+        for (var i = 0; i < entries.Length; i++)
         {
-            output.Add(line);
+            var entry = entries[i];
+            if (entry.Length <= 3)
+            {
+                continue;
+            }
+
+            changed.Add(StripPrefix(entry[3..], repositoryPrefix));
+
+            // Renames and copies, in either the index or the worktree column, are followed by their source path.
+            // A renamed-away source no longer exists and counts as changed; a copy's source is untouched.
+            var isRename = entry[0] == 'R' || entry[1] == 'R';
+            var isCopy = entry[0] == 'C' || entry[1] == 'C';
+            if ((isRename || isCopy) && i + 1 < entries.Length)
+            {
+                var source = entries[++i];
+                if (isRename)
+                {
+                    changed.Add(StripPrefix(source, repositoryPrefix));
+                }
+            }
         }
+
+        return changed;
     }
 
+    // Porcelain paths are repository-relative; strip the prefix so they match the workspace root.
+    private static string StripPrefix(string path, string repositoryPrefix)
+        => path.StartsWith(repositoryPrefix, StringComparison.Ordinal)
+            ? path[repositoryPrefix.Length..]
+            : path;
+
     private static string QuoteArgument(string value)
         => value.Contains(' ', StringComparison.Ordinal)
             ? $"\"{value.Replace("\"", "\\\"", StringComparison.Ordinal)}\""
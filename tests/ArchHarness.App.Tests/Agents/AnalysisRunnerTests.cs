@@ -0,0 +1,76 @@
+using ArchHarness.App.Agents;
+using ArchHarness.App.Core;
+
+namespace ArchHarness.App.Tests.Agents;
+
+public sealed class AnalysisRunnerTests
+{
+    private const int OVERSIZED_FILE_BYTES = (1024 * 1024) + 1;
+
+    [Fact]
+    public void ResolveCandidateFiles_DoesNotScanWorkspace_WhenDiffNamesOnlyOversizedSources()
+    {
+        var root = CreateWorkspace();
+        try
+        {
+            var skippedFiles = new List<string>();
+
+            var candidates = AnalysisRunner.ResolveCandidateFiles("Large.cs", root, skippedFiles);
+
+            Assert.Empty(candidates);
+            Assert.Equal(new[] { Path.Combine(root, "Large.cs") }, skippedFiles);
+        }
+        finally
+        {
+            Directory.Delete(root, recursive: true);
+        }
+    }
+
+    [Fact]
+    public void ResolveCandidateFiles_ScansWorkspace_WhenDiffNamesNoSources()
+    {
+        var root = CreateWorkspace();
+        try
+        {
+            var skippedFiles = new List<string>();
+
+            var candidates = AnalysisRunner.ResolveCandidateFiles("README.md", root, skippedFiles);
+
+            Assert.Equal(new[] { Path.Combine(root, "src", "Small.cs") }, candidates);
+            Assert.Equal(new[] { Path.Combine(root, "Large.cs") }, skippedFiles);
+        }
+        finally
+        {
+            Directory.Delete(root, recursive: true);
+        }
+    }
+
+    [Fact]
+    public void Analyze_ReportsSkippedFileFinding_ForOversizedSource()
+    {
+        var root = CreateWorkspace();
+        try
+        {
+            var review = AnalysisRunner.Analyze("Large.cs", root, new[] { "Large.cs" });
+
+            var finding = Assert.Single(review.Findings);
+            Assert.Equal(new ArchitectureFinding("low", "Coverage", "Large.cs", "SkippedFile", finding.Rationale), finding);
+            Assert.Empty(review.RequiredActions);
+        }
+        finally
+        {
+            Directory.Delete(root, recursive: true);
+        }
+    }
+
+    private static string CreateWorkspace()
+    {
+        var root = Path.Combine(Path.GetTempPath(), "archharness-analysis-tests", Guid.NewGuid().ToString("N"));
+        Directory.CreateDirectory(Path.Combine(root, "src"));
+        Directory.CreateDirectory(Path.Combine(root, "src", "bin"));
+        File.WriteAllText(Path.Combine(root, "src", "Small.cs"), "public sealed class Small { }");
+        File.WriteAllText(Path.Combine(root, "src", "bin", "Generated.cs"), "public sealed class Generated { }");
+        File.WriteAllText(Path.Combine(root, "Large.cs"), "// " + new string('x', OVERSIZED_FILE_BYTES));
+        return root;
+    }
+}
@@ -0,0 +1,29 @@
+using ArchHarness.App.Core;
+
+namespace ArchHarness.App.Tests.Core;
+
+public sealed class AgentsOptionsTests
+{
+    [Fact]
+    public void ForRole_ReturnsStyleOptions_ForStyleRole()
+    {
+        var options = new AgentsOptions
+        {
+            Style = new AgentModelOptions { Model = "style-model", DisableGuidelines = true }
+        };
+
+        var resolved = options.ForRole("Style");
+
+        Assert.Same(options.Style, resolved);
+        Assert.True(resolved.DisableGuidelines);
+    }
+
+    [Fact]
+    public void ForRole_ReturnsEmptyOptions_ForUnknownRole()
+    {
+        var resolved = new AgentsOptions().ForRole("unknown");
+
+        Assert.Equal(string.Empty, resolved.Model);
+        Assert.False(resolved.DisableGuidelines);
+    }
+}
@@ -55,6 +55,30 @@ public sealed class BuildCommandInferenceTests
         }
     }
 
+    [Fact]
+    public void Select_IgnoresProjectsUnderBuildOutputDirectories()
+    {
+        var root = CreateTempWorkspace();
+        try
+        {
+            var appProj = Path.Combine(root, "src", "MyApp", "MyApp.csproj");
+            var copiedProj = Path.Combine(root, "src", "MyApp", "bin", "Debug", "Copied.csproj");
+            Directory.CreateDirectory(Path.GetDirectoryName(copiedProj)!);
+            File.WriteAllText(appProj, "<Project/>");
+            File.WriteAllText(copiedProj, "<Project/>");
+
+            var selection = BuildCommandInference.Select(root, null, "existing-folder", "Copied");
+
+            Assert.NotNull(selection.Command);
+            Assert.Contains(appProj, selection.Command!, StringComparison.OrdinalIgnoreCase);
+            Assert.DoesNotContain(copiedProj, selection.Command!, StringComparison.OrdinalIgnoreCase);
+        }
+        finally
+        {
+            CleanupTempWorkspace(root);
+        }
+    }
+
     [Fact]
     public void Select_NewProjectFallback_WhenNoTargetsExist()
     {
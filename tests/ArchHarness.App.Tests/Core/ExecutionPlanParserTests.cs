@@ -2,42 +2,40 @@ using ArchHarness.App.Core;
 
 namespace ArchHarness.App.Tests.Core;
 
-public sealed class ExecutionPlanParserTests
+public sealed class ExecutionPlanParserTests : IClassFixture<ExecutionPlanParserTests.WorkspaceFixture>
 {
     private readonly ExecutionPlanParser _parser = new ExecutionPlanParser(new WorkspaceContextAnalyzer());
+    private readonly WorkspaceFixture _workspace;
+
+    public ExecutionPlanParserTests(WorkspaceFixture workspace)
+    {
+        _workspace = workspace;
+    }
 
     [Fact]
     public void TryBuildExecutionPlan_ValidJson_ReturnsCorrectPlan()
     {
-        string workspaceRoot = CreateTempWorkspace();
-        try
-        {
-            string json = """
-                {
-                    "steps": [
-                        {"id":1,"agent":"Builder","objective":"Implement feature X"},
-                        {"id":2,"agent":"Style","objective":"Review and enforce style"},
-                        {"id":3,"agent":"Architecture","objective":"Review and enforce architecture","dependsOn":[2]}
-                    ],
-                    "iterationStrategy": {"maxIterations": 3, "reviewRequired": true},
-                    "completionCriteria": ["No high severity style findings","No high severity architecture findings","Build passes"]
-                }
-                """;
-
-            bool result = _parser.TryBuildExecutionPlan(json, workspaceRoot, out ExecutionPlan plan, out string? error);
-
-            Assert.True(result, $"Expected success but got error: {error}");
-            Assert.Null(error);
-            Assert.NotNull(plan);
-            Assert.True(plan.Steps.Count >= 3);
-            Assert.Equal(3, plan.IterationStrategy.MaxIterations);
-            Assert.True(plan.IterationStrategy.ReviewRequired);
-            Assert.True(plan.CompletionCriteria.Count >= 3);
-        }
-        finally
-        {
-            CleanupTempWorkspace(workspaceRoot);
-        }
+        string json = """
+            {
+                "steps": [
+                    {"id":1,"agent":"Builder","objective":"Implement feature X"},
+                    {"id":2,"agent":"Style","objective":"Review and enforce style"},
+                    {"id":3,"agent":"Architecture","objective":"Review and enforce architecture","dependsOn":[2]}
+                ],
+                "iterationStrategy": {"maxIterations": 3, "reviewRequired": true},
+                "completionCriteria": ["No high severity style findings","No high severity architecture findings","Build passes"]
+            }
+            """;
+
+        bool result = _parser.TryBuildExecutionPlan(json, _workspace.Root, out ExecutionPlan plan, out string? error);
+
+        Assert.True(result, $"Expected success but got error: {error}");
+        Assert.Null(error);
+        Assert.NotNull(plan);
+        Assert.True(plan.Steps.Count >= 3);
+        Assert.Equal(3, plan.IterationStrategy.MaxIterations);
+        Assert.True(plan.IterationStrategy.ReviewRequired);
+        Assert.True(plan.CompletionCriteria.Count >= 3);
     }
 
     [Theory]
@@ -47,49 +45,33 @@ public sealed class ExecutionPlanParserTests
     [InlineData("""{"steps":[{"id":1,"agent":"Builder","objective":"build"}],"iterationStrategy":{}}""", "completionCriteria")]
     public void TryBuildExecutionPlan_MissingRequiredFields_ReturnsFailure(string json, string expectedErrorToken)
     {
-        string workspaceRoot = CreateTempWorkspace();
-        try
-        {
-            bool result = _parser.TryBuildExecutionPlan(json, workspaceRoot, out _, out string? error);
+        bool result = _parser.TryBuildExecutionPlan(json, _workspace.Root, out _, out string? error);
 
-            Assert.False(result);
-            Assert.NotNull(error);
-            Assert.Contains(expectedErrorToken, error, StringComparison.OrdinalIgnoreCase);
-        }
-        finally
-        {
-            CleanupTempWorkspace(workspaceRoot);
-        }
+        Assert.False(result);
+        Assert.NotNull(error);
+        Assert.Contains(expectedErrorToken, error, StringComparison.OrdinalIgnoreCase);
     }
 
     [Fact]
     public void TryBuildExecutionPlan_InvalidDependencyIds_ReturnsFailure()
     {
-        string workspaceRoot = CreateTempWorkspace();
-        try
-        {
-            string json = """
-                {
-                    "steps": [
-                        {"id":1,"agent":"Builder","objective":"build things"},
-                        {"id":2,"agent":"Style","objective":"review style","dependsOn":[0]},
-                        {"id":3,"agent":"Architecture","objective":"review architecture"}
-                    ],
-                    "iterationStrategy": {"maxIterations": 2, "reviewRequired": true},
-                    "completionCriteria": ["Build passes"]
-                }
-                """;
-
-            bool result = _parser.TryBuildExecutionPlan(json, workspaceRoot, out _, out string? error);
-
-            Assert.False(result);
-            Assert.NotNull(error);
-            Assert.Contains("dependsOn", error, StringComparison.OrdinalIgnoreCase);
-        }
-        finally
-        {
-            CleanupTempWorkspace(workspaceRoot);
-        }
+        string json = """
+            {
+                "steps": [
+                    {"id":1,"agent":"Builder","objective":"build things"},
+                    {"id":2,"agent":"Style","objective":"review style","dependsOn":[0]},
+                    {"id":3,"agent":"Architecture","objective":"review architecture"}
+                ],
+                "iterationStrategy": {"maxIterations": 2, "reviewRequired": true},
+                "completionCriteria": ["Build passes"]
+            }
+            """;
+
+        bool result = _parser.TryBuildExecutionPlan(json, _workspace.Root, out _, out string? error);
+
+        Assert.False(result);
+        Assert.NotNull(error);
+        Assert.Contains("dependsOn", error, StringComparison.OrdinalIgnoreCase);
     }
 
     [Fact]
@@ -136,66 +118,55 @@ public sealed class ExecutionPlanParserTests
     [Fact]
     public void TryBuildExecutionPlan_NoJsonInResponse_ReturnsFailure()
     {
-        string workspaceRoot = CreateTempWorkspace();
-        try
-        {
-            bool result = _parser.TryBuildExecutionPlan("No JSON here at all", workspaceRoot, out _, out string? error);
+        bool result = _parser.TryBuildExecutionPlan("No JSON here at all", _workspace.Root, out _, out string? error);
 
-            Assert.False(result);
-            Assert.NotNull(error);
-            Assert.Contains("No JSON", error, StringComparison.OrdinalIgnoreCase);
-        }
-        finally
-        {
-            CleanupTempWorkspace(workspaceRoot);
-        }
+        Assert.False(result);
+        Assert.NotNull(error);
+        Assert.Contains("No JSON", error, StringComparison.OrdinalIgnoreCase);
     }
 
     [Fact]
     public void TryBuildExecutionPlan_JsonInMarkdownFence_ParsesSuccessfully()
     {
-        string workspaceRoot = CreateTempWorkspace();
-        try
-        {
-            string raw = """
-                Here is the plan:
-                ```json
-                {
-                    "steps": [
-                        {"id":1,"agent":"Builder","objective":"Build feature"},
-                        {"id":2,"agent":"Style","objective":"Review style enforcement"},
-                        {"id":3,"agent":"Architecture","objective":"Review architecture enforcement"}
-                    ],
-                    "iterationStrategy": {"maxIterations": 2, "reviewRequired": true},
-                    "completionCriteria": ["Style clean","Architecture clean","Build passes"]
-                }
-                ```
-                """;
-
-            bool result = _parser.TryBuildExecutionPlan(raw, workspaceRoot, out ExecutionPlan plan, out string? error);
-
-            Assert.True(result, $"Expected success but got error: {error}");
-            Assert.NotNull(plan);
-        }
-        finally
-        {
-            CleanupTempWorkspace(workspaceRoot);
-        }
+        string raw = """
+            Here is the plan:
+            ```json
+            {
+                "steps": [
+                    {"id":1,"agent":"Builder","objective":"Build feature"},
+                    {"id":2,"agent":"Style","objective":"Review style enforcement"},
+                    {"id":3,"agent":"Architecture","objective":"Review architecture enforcement"}
+                ],
+                "iterationStrategy": {"maxIterations": 2, "reviewRequired": true},
+                "completionCriteria": ["Style clean","Architecture clean","Build passes"]
+            }
+            ```
+            """;
+
+        bool result = _parser.TryBuildExecutionPlan(raw, _workspace.Root, out ExecutionPlan plan, out string? error);
+
+        Assert.True(result, $"Expected success but got error: {error}");
+        Assert.NotNull(plan);
     }
 
-    private static string CreateTempWorkspace()
+    // The parser only reads the workspace to detect languages, so the tests share one temporary workspace.
+    public sealed class WorkspaceFixture : IDisposable
     {
-        string path = Path.Combine(Path.GetTempPath(), "ArchHarness.Tests", Guid.NewGuid().ToString("N"));
-        Directory.CreateDirectory(path);
-        File.WriteAllText(Path.Combine(path, "App.csproj"), "<Project/>");
-        return path;
-    }
+        public WorkspaceFixture()
+        {
+            Root = Path.Combine(Path.GetTempPath(), "ArchHarness.Tests", Guid.NewGuid().ToString("N"));
+            Directory.CreateDirectory(Root);
+            File.WriteAllText(Path.Combine(Root, "App.csproj"), "<Project/>");
+        }
 
-    private static void CleanupTempWorkspace(string path)
-    {
-        if (Directory.Exists(path))
+        public string Root { get; }
+
+        public void Dispose()
         {
-            Directory.Delete(path, recursive: true);
+            if (Directory.Exists(Root))
+            {
+                Directory.Delete(Root, recursive: true);
+            }
         }
     }
 }
@@ -0,0 +1,30 @@
+using ArchHarness.App.Core;
+
+namespace ArchHarness.App.Tests.Core;
+
+public sealed class RedactionTests
+{
+    [Fact]
+    public void RedactSecrets_MasksJsonSecretValue_AndKeepsClosingQuote()
+    {
+        var output = Redaction.RedactSecrets("{\"apiKey\": \"abc123\", \"name\": \"demo\"}");
+
+        Assert.Equal("{\"apiKey\": \"***REDACTED***\", \"name\": \"demo\"}", output);
+    }
+
+    [Fact]
+    public void RedactSecrets_MasksEnvStyleSecretsAndGitHubTokens()
+    {
+        var output = Redaction.RedactSecrets("TOKEN=s3cr3t; auth ghp_abcdefghijklmnop1234");
+
+        Assert.Equal("TOKEN=***REDACTED***; auth ***REDACTED***", output);
+    }
+
+    [Fact]
+    public void RedactSecrets_ReturnsSameInstance_WhenNothingSensitive()
+    {
+        var input = "Review iteration 2 found high severity findings.";
+
+        Assert.Same(input, Redaction.RedactSecrets(input));
+    }
+}
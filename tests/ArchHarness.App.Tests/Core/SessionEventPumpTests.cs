@@ -101,5 +101,14 @@ public sealed class SessionEventPumpTests
             AppendedEvents.Add(evt);
             return Task.CompletedTask;
         }
+
+        public Task AppendEventsAsync(string runDirectory, IReadOnlyList<object> events, CancellationToken cancellationToken)
+        {
+            AppendedEvents.AddRange(events);
+            return Task.CompletedTask;
+        }
+
+        public Task CloseEventLogAsync(string runDirectory)
+            => Task.CompletedTask;
     }
 }
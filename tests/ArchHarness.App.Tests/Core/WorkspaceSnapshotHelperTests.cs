@@ -0,0 +1,68 @@
+using ArchHarness.App.Core;
+
+namespace ArchHarness.App.Tests.Core;
+
+public sealed class WorkspaceSnapshotHelperTests
+{
+    [Fact]
+    public void DetectChanges_IgnoresRunArtefacts()
+    {
+        var root = CreateTempWorkspace();
+        try
+        {
+            File.WriteAllText(Path.Combine(root, "Program.cs"), "class Program {}");
+            var baseline = WorkspaceSnapshotHelper.CaptureSnapshot(root);
+
+            var runDirectory = Path.Combine(root, ".agent-harness", "runs", "run-1");
+            Directory.CreateDirectory(runDirectory);
+            File.WriteAllText(Path.Combine(runDirectory, "events.jsonl"), "{}");
+            File.WriteAllText(Path.Combine(root, "Added.cs"), "class Added {}");
+
+            var changed = WorkspaceSnapshotHelper.DetectChanges(root, baseline);
+
+            Assert.Equal("Added.cs", Assert.Single(changed));
+        }
+        finally
+        {
+            CleanupTempWorkspace(root);
+        }
+    }
+
+    [Fact]
+    public void EnumerateFiles_PrunesBuildOutputButKeepsLookalikeDirectories()
+    {
+        var root = CreateTempWorkspace();
+        try
+        {
+            Directory.CreateDirectory(Path.Combine(root, "src", "bin"));
+            Directory.CreateDirectory(Path.Combine(root, "src", "binary"));
+            File.WriteAllText(Path.Combine(root, "src", "bin", "x.cs"), "class X {}");
+            File.WriteAllText(Path.Combine(root, "src", "binary", "x.cs"), "class X {}");
+
+            var relativePaths = WorkspaceSnapshotHelper.EnumerateFiles(root).Select(file => file.RelativePath).ToArray();
+            var fullPaths = WorkspaceSnapshotHelper.EnumerateFilePaths(root).ToArray();
+
+            Assert.Equal(new[] { Path.Combine("src", "binary", "x.cs") }, relativePaths);
+            Assert.Equal(new[] { Path.Combine(root, "src", "binary", "x.cs") }, fullPaths);
+        }
+        finally
+        {
+            CleanupTempWorkspace(root);
+        }
+    }
+
+    private static string CreateTempWorkspace()
+    {
+        var path = Path.Combine(Path.GetTempPath(), "ArchHarness.Tests", Guid.NewGuid().ToString("N"));
+        Directory.CreateDirectory(path);
+        return path;
+    }
+
+    private static void CleanupTempWorkspace(string path)
+    {
+        if (Directory.Exists(path))
+        {
+            Directory.Delete(path, recursive: true);
+        }
+    }
+}
@@ -0,0 +1,35 @@
+using ArchHarness.App.Storage;
+
+namespace ArchHarness.App.Tests.Storage;
+
+public sealed class ArtefactStoreTests
+{
+    [Fact]
+    public async Task AppendEventAsync_AfterClose_WritesWithoutHoldingTheLogOpen()
+    {
+        var runDirectory = Path.Combine(Path.GetTempPath(), "ArchHarness.Tests", Guid.NewGuid().ToString("N"));
+        Directory.CreateDirectory(runDirectory);
+        try
+        {
+            using var store = new ArtefactStore();
+            await store.AppendEventAsync(runDirectory, new { message = "Run started" }, CancellationToken.None);
+            await store.CloseEventLogAsync(runDirectory);
+
+            await store.AppendEventAsync(runDirectory, new { message = "Late session event" }, CancellationToken.None);
+
+            var eventsPath = Path.Combine(runDirectory, "events.jsonl");
+            using (var exclusive = new FileStream(eventsPath, FileMode.Open, FileAccess.ReadWrite, FileShare.None))
+            {
+                Assert.True(exclusive.Length > 0);
+            }
+
+            var lines = File.ReadAllLines(eventsPath);
+            Assert.Equal(2, lines.Length);
+            Assert.Contains("Late session event", lines[1], StringComparison.Ordinal);
+        }
+        finally
+        {
+            Directory.Delete(runDirectory, recursive: true);
+        }
+    }
+}
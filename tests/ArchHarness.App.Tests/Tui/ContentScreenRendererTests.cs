@@ -0,0 +1,95 @@
+using System.Text;
+using ArchHarness.App.Tui;
+
+namespace ArchHarness.App.Tests.Tui;
+
+/// <summary>
+/// Verifies ContentScreenRenderer.ReadTailLines matches reading every line and keeping the last ones.
+/// </summary>
+public class ContentScreenRendererTests
+{
+    /// <summary>
+    /// A final line without a trailing newline should still be returned.
+    /// </summary>
+    [Fact]
+    public void ReadTailLines_NoTrailingNewline_ReturnsFinalLine()
+    {
+        AssertTail("first\nsecond\nthird", 2, "second", "third");
+    }
+
+    /// <summary>
+    /// CRLF line endings should not leave carriage returns on the returned lines.
+    /// </summary>
+    [Fact]
+    public void ReadTailLines_CrLfLineEndings_StripsCarriageReturns()
+    {
+        AssertTail("first\r\nsecond\r\nthird\r\n", 2, "second", "third");
+    }
+
+    /// <summary>
+    /// An empty file should yield no lines.
+    /// </summary>
+    [Fact]
+    public void ReadTailLines_EmptyFile_ReturnsNoLines()
+    {
+        AssertTail(string.Empty, 5);
+    }
+
+    /// <summary>
+    /// A file shorter than the requested tail should be returned in full.
+    /// </summary>
+    [Fact]
+    public void ReadTailLines_FewerLinesThanMax_ReturnsWholeFile()
+    {
+        AssertTail("first\nsecond\n", 10, "first", "second");
+    }
+
+    /// <summary>
+    /// A multi-byte character straddling the 4 KB read block boundary should decode intact.
+    /// </summary>
+    [Fact]
+    public void ReadTailLines_MultiByteCharacterAcrossBufferBoundary_DecodesIntact()
+    {
+        // "€" is three UTF-8 bytes; the padding puts the first 4 KB block boundary after its first byte.
+        string longLine = "€" + new string('x', 4089);
+        string content = "first\n" + longLine + "\nlast";
+        Assert.Equal(4096 + 1, Encoding.UTF8.GetByteCount(longLine + "\nlast"));
+
+        AssertTail(content, 2, longLine, "last");
+    }
+
+    /// <summary>
+    /// Requesting no lines should return nothing rather than the whole file.
+    /// </summary>
+    [Fact]
+    public void ReadTailLines_ZeroMaxLines_ReturnsNoLines()
+    {
+        AssertTail("first\nsecond\n", 0);
+    }
+
+    /// <summary>
+    /// Requesting one line should return only the final line, ignoring the trailing newline.
+    /// </summary>
+    [Fact]
+    public void ReadTailLines_OneMaxLine_ReturnsFinalLine()
+    {
+        AssertTail("first\nsecond\n", 1, "second");
+    }
+
+    private static void AssertTail(string content, int maxLines, params string[] expected)
+    {
+        string path = Path.Combine(Path.GetTempPath(), $"archharness-tail-{Guid.NewGuid():N}.txt");
+        File.WriteAllText(path, content, new UTF8Encoding(encoderShouldEmitUTF8Identifier: false));
+        try
+        {
+            string[] lines = ContentScreenRenderer.ReadTailLines(path, maxLines);
+
+            Assert.Equal(expected, lines);
+            Assert.Equal(File.ReadLines(path).TakeLast(maxLines), lines);
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+}
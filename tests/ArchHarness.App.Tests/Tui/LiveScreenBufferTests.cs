@@ -0,0 +1,104 @@
+using ArchHarness.App.Tui;
+
+namespace ArchHarness.App.Tests.Tui;
+
+/// <summary>
+/// Verifies LiveScreenBuffer only skips rows it can trust are still on screen.
+/// </summary>
+public class LiveScreenBufferTests
+{
+    private static readonly (int Left, int Top) FrameEnd = (0, 30);
+
+    /// <summary>
+    /// A row unchanged since the previous frame should not be written again.
+    /// </summary>
+    [Fact]
+    public void ShouldWriteRow_UnchangedRow_IsSkipped()
+    {
+        LiveScreenBuffer screen = DrawFrame(new LiveScreenBuffer(), "status");
+
+        screen.BeginFrame(80, 40, FrameEnd);
+
+        Assert.False(screen.ShouldWriteRow(0, "status", ConsoleColor.White));
+        Assert.True(screen.ShouldWriteRow(1, "new row", ConsoleColor.White));
+    }
+
+    /// <summary>
+    /// A changed colour alone should cause the row to be written.
+    /// </summary>
+    [Fact]
+    public void ShouldWriteRow_ChangedColor_IsWritten()
+    {
+        LiveScreenBuffer screen = DrawFrame(new LiveScreenBuffer(), "status");
+
+        screen.BeginFrame(80, 40, FrameEnd);
+
+        Assert.True(screen.ShouldWriteRow(0, "status", ConsoleColor.Red));
+    }
+
+    /// <summary>
+    /// Console output from elsewhere moves the cursor, so every row should be repainted.
+    /// </summary>
+    [Fact]
+    public void BeginFrame_CursorMovedSinceLastFrame_RepaintsAllRows()
+    {
+        LiveScreenBuffer screen = DrawFrame(new LiveScreenBuffer(), "status");
+
+        screen.BeginFrame(80, 40, (12, 31));
+
+        Assert.True(screen.ShouldWriteRow(0, "status", ConsoleColor.White));
+    }
+
+    /// <summary>
+    /// A resized window should repaint every row.
+    /// </summary>
+    [Fact]
+    public void BeginFrame_WindowResized_RepaintsAllRows()
+    {
+        LiveScreenBuffer screen = DrawFrame(new LiveScreenBuffer(), "status");
+
+        screen.BeginFrame(100, 40, FrameEnd);
+
+        Assert.True(screen.ShouldWriteRow(0, "status", ConsoleColor.White));
+    }
+
+    /// <summary>
+    /// Unchanged rows should still be repainted periodically in case foreign output went undetected.
+    /// </summary>
+    [Fact]
+    public void BeginFrame_AfterRepaintInterval_RepaintsAllRows()
+    {
+        LiveScreenBuffer screen = new LiveScreenBuffer();
+        bool repainted = false;
+        for (int frame = 0; frame < 30 && !repainted; frame++)
+        {
+            screen.BeginFrame(80, 40, FrameEnd);
+            repainted = screen.ShouldWriteRow(0, "status", ConsoleColor.White) && frame > 0;
+            screen.EndFrame(FrameEnd);
+        }
+
+        Assert.True(repainted);
+    }
+
+    /// <summary>
+    /// Invalidating (after the console is cleared) should repaint every row.
+    /// </summary>
+    [Fact]
+    public void Invalidate_RepaintsAllRows()
+    {
+        LiveScreenBuffer screen = DrawFrame(new LiveScreenBuffer(), "status");
+
+        screen.Invalidate();
+        screen.BeginFrame(80, 40, FrameEnd);
+
+        Assert.True(screen.ShouldWriteRow(0, "status", ConsoleColor.White));
+    }
+
+    private static LiveScreenBuffer DrawFrame(LiveScreenBuffer screen, string row)
+    {
+        screen.BeginFrame(80, 40, (0, 0));
+        screen.ShouldWriteRow(0, row, ConsoleColor.White);
+        screen.EndFrame(FrameEnd);
+        return screen;
+    }
+}
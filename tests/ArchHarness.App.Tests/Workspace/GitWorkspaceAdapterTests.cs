@@ -0,0 +1,106 @@
+using System.Diagnostics;
+using ArchHarness.App.Workspace;
+
+namespace ArchHarness.App.Tests.Workspace;
+
+public sealed class GitWorkspaceAdapterTests
+{
+    [Fact]
+    public void ParsePorcelainPaths_ConsumesRenameAndCopySourcePaths()
+    {
+        var raw = "R  src/New.cs\0src/Old.cs\0"
+            + "C  src/Copy.cs\0src/Original.cs\0"
+            + " R docs/Moved.md\0docs/Draft.md\0"
+            + " M src/Edited.cs\0"
+            + "?? src/Added.cs\0";
+
+        var paths = GitWorkspaceAdapter.ParsePorcelainPaths(raw, string.Empty);
+
+        Assert.Equal(
+            new[] { "docs/Draft.md", "docs/Moved.md", "src/Added.cs", "src/Copy.cs", "src/Edited.cs", "src/New.cs", "src/Old.cs" },
+            paths.OrderBy(path => path, StringComparer.Ordinal));
+    }
+
+    [Fact]
+    public void ParsePorcelainPaths_StripsRepositoryPrefix()
+    {
+        var raw = " M app/src/Edited.cs\0R  app/src/New.cs\0app/src/Old.cs\0";
+
+        var paths = GitWorkspaceAdapter.ParsePorcelainPaths(raw, "app/");
+
+        Assert.Equal(
+            new[] { "src/Edited.cs", "src/New.cs", "src/Old.cs" },
+            paths.OrderBy(path => path, StringComparer.Ordinal));
+    }
+
+    [Fact]
+    public async Task DiffAsync_FallsBackToSnapshot_WhenGitStatusFails()
+    {
+        var root = CreateRepository();
+        try
+        {
+            var adapter = new GitWorkspaceAdapter(root);
+            await adapter.InitializeAsync(projectName: null, initGit: false, CancellationToken.None);
+
+            await File.WriteAllTextAsync(Path.Combine(root, "Added.cs"), "class Added {}");
+            await File.WriteAllTextAsync(Path.Combine(root, ".git", "index"), "not an index");
+
+            var diff = await adapter.DiffAsync(CancellationToken.None);
+
+            Assert.Equal("Added.cs", diff);
+        }
+        finally
+        {
+            Directory.Delete(root, recursive: true);
+        }
+    }
+
+    [Fact]
+    public async Task DiffAsync_ReportsChangesCommittedDuringTheRun()
+    {
+        var root = CreateRepository();
+        try
+        {
+            await File.WriteAllTextAsync(Path.Combine(root, "Existing.cs"), "class Existing {}");
+            RunGit(root, "add -A");
+            RunGit(root, "commit -q -m baseline");
+
+            var adapter = new GitWorkspaceAdapter(root);
+            await adapter.InitializeAsync(projectName: null, initGit: false, CancellationToken.None);
+
+            await File.WriteAllTextAsync(Path.Combine(root, "Committed.cs"), "class Committed {}");
+            RunGit(root, "add -A");
+            RunGit(root, "commit -q -m change");
+
+            var diff = await adapter.DiffAsync(CancellationToken.None);
+
+            Assert.Equal("Committed.cs", diff);
+        }
+        finally
+        {
+            Directory.Delete(root, recursive: true);
+        }
+    }
+
+    private static string CreateRepository()
+    {
+        var root = Path.Combine(Path.GetTempPath(), "archharness-git-tests", Guid.NewGuid().ToString("N"));
+        Directory.CreateDirectory(root);
+        RunGit(root, "init -q");
+        return root;
+    }
+
+    private static void RunGit(string root, string arguments)
+    {
+        var info = new ProcessStartInfo("git", $"-C \"{root}\" -c user.name=test -c user.email=test@example.com {arguments}")
+        {
+            RedirectStandardOutput = true,
+            RedirectStandardError = true,
+            UseShellExecute = false
+        };
+
+        using var process = Process.Start(info)!;
+        process.WaitForExit();
+        Assert.Equal(0, process.ExitCode);
+    }
+}